@@ -292,6 +292,23 @@ function registerPythonHelpers(): void {
         }
         return '';
     });
+    Handlebars.registerHelper(
+        'toPythonLiteral',
+        (json: string) => new Handlebars.SafeString(utils.toPythonLiteral(JSON.parse(json))),
+    );
+    Handlebars.registerHelper('canCallBySelector', (method: MethodAbi): boolean => {
+        // read-only methods can be called by encoding their arguments
+        // directly, skipping web3.py's ContractFunction machinery, as long as
+        // none of their parameters are tuples, whose generated TypedDict
+        // representations web3.py would otherwise have to convert.
+        const isTuple = (parameter: DataItem): boolean => parameter.type.startsWith('tuple');
+        return (
+            method.constant &&
+            method.outputs.length > 0 &&
+            !method.inputs.some(isTuple) &&
+            !method.outputs.some(isTuple)
+        );
+    });
     Handlebars.registerHelper(
         'toPythonClassname',
         (sourceName: string) => new Handlebars.SafeString(changeCase.pascal(sourceName)),
@@ -373,7 +390,9 @@ for (const abiFileName of abiFileNames) {
                 input.name = `index_${inputIndex}`;
             }
         });
-        const functionSignature = new AbiEncoder.Method(methodAbi).getSignature();
+        const methodEncoder = new AbiEncoder.Method(methodAbi);
+        const functionSignature = methodEncoder.getSignature();
+        const functionSelector = methodEncoder.getSelector();
         const languageSpecificName: string = makeLanguageSpecificName(sanitizedMethodAbis[methodAbiIndex].name);
         // This will make templates simpler
         const methodData = {
@@ -382,6 +401,7 @@ for (const abiFileName of abiFileNames) {
             hasReturnValue: methodAbi.outputs.length !== 0,
             languageSpecificName,
             functionSignature,
+            functionSelector,
             devdoc: devdoc ? devdoc.methods[functionSignature] : undefined,
         };
         return methodData;
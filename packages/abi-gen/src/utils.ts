@@ -350,6 +350,33 @@ export const utils = {
             hangingIndent: ' '.repeat(columnsPerIndent),
         });
     },
+    /**
+     * Render a JSON-compatible value (such as a contract ABI) as a Python
+     * literal, so that generated code needn't parse JSON at runtime.
+     */
+    toPythonLiteral(value: any): string {
+        if (value === null) {
+            return 'None';
+        }
+        if (value === true) {
+            return 'True';
+        }
+        if (value === false) {
+            return 'False';
+        }
+        if (_.isArray(value)) {
+            return `[${value.map(utils.toPythonLiteral.bind(utils)).join(', ')}]`;
+        }
+        if (_.isObject(value)) {
+            const items = _.map(
+                value,
+                (itemValue: any, key: string) => `${JSON.stringify(key)}: ${utils.toPythonLiteral(itemValue)}`,
+            );
+            return `{${items.join(', ')}}`;
+        }
+        // JSON string and number syntax is also valid Python
+        return JSON.stringify(value);
+    },
     extractTuples(
         parameter: DataItem,
         tupleBodies: { [pythonTupleName: string]: string }, // output
@@ -2,16 +2,18 @@
 
 # pylint: disable=too-many-arguments
 
-import json
+from concurrent.futures import Future  # pylint: disable=unused-import
 from typing import (  # pylint: disable=unused-import
     Any,
+    Dict,
     List,
+    MutableMapping,
     Optional,
     Tuple,
     Union,
 )
 
-from eth_utils import to_checksum_address
+from eth_utils import event_abi_to_log_topic, to_checksum_address
 from mypy_extensions import TypedDict  # pylint: disable=unused-import
 from hexbytes import HexBytes
 from web3 import Web3
@@ -19,7 +21,11 @@ from web3.contract import ContractFunction
 from web3.datastructures import AttributeDict
 from web3.providers.base import BaseProvider
 
-from zero_ex.contract_wrappers.bases import ContractMethod, Validator
+from zero_ex.contract_wrappers.bases import (
+    BatchScheduler,
+    ContractMethod,
+    Validator,
+)
 from zero_ex.contract_wrappers.tx_params import TxParams
 
 
@@ -181,19 +187,30 @@ class SimpleRequireMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
-    def call(self, tx_params: Optional[TxParams] = None) -> None:
+    def call(
+        self,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
+    ) -> None:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method().call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_function(
+            self.underlying_method(), tx_params, block_identifier
+        )
 
     def send_transaction(
         self, tx_params: Optional[TxParams] = None
@@ -203,12 +220,12 @@ class SimpleRequireMethod(ContractMethod):
         :param tx_params: transaction parameters
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().transact(tx_params.as_dict())
 
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().estimateGas(tx_params.as_dict())
 
 
@@ -221,9 +238,13 @@ class AcceptsAnArrayOfBytesMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
     def validate_and_normalize_inputs(self, a: List[bytes]):
@@ -237,7 +258,10 @@ class AcceptsAnArrayOfBytesMethod(ContractMethod):
         return a
 
     def call(
-        self, a: List[bytes], tx_params: Optional[TxParams] = None
+        self,
+        a: List[bytes],
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
     ) -> None:
         """Execute underlying contract method via eth_call.
 
@@ -245,11 +269,14 @@ class AcceptsAnArrayOfBytesMethod(ContractMethod):
 
         :param a: the array of bytes being accepted
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
 
         """
         (a) = self.validate_and_normalize_inputs(a)
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method(a).call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_function(
+            self.underlying_method(a), tx_params, block_identifier
+        )
 
     def send_transaction(
         self, a: List[bytes], tx_params: Optional[TxParams] = None
@@ -263,7 +290,7 @@ class AcceptsAnArrayOfBytesMethod(ContractMethod):
 
         """
         (a) = self.validate_and_normalize_inputs(a)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(a).transact(tx_params.as_dict())
 
     def estimate_gas(
@@ -271,7 +298,7 @@ class AcceptsAnArrayOfBytesMethod(ContractMethod):
     ) -> int:
         """Estimate gas consumption of method call."""
         (a) = self.validate_and_normalize_inputs(a)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(a).estimateGas(tx_params.as_dict())
 
 
@@ -284,9 +311,13 @@ class SimpleInputSimpleOutputMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
     def validate_and_normalize_inputs(self, index_0: int):
@@ -296,21 +327,66 @@ class SimpleInputSimpleOutputMethod(ContractMethod):
             parameter_name="index_0",
             argument_value=index_0,
         )
-        # safeguard against fractional inputs
-        index_0 = int(index_0)
+        # safeguard against fractional inputs, skipping the common case of an
+        # exact int (but not a bool)
+        if type(index_0) is not int:  # pylint: disable=unidiomatic-typecheck
+            index_0 = int(index_0)
         return index_0
 
-    def call(self, index_0: int, tx_params: Optional[TxParams] = None) -> int:
+    def call(
+        self,
+        index_0: int,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
+    ) -> int:
         """Execute underlying contract method via eth_call.
 
         Tests decoding when both input and output are non-empty.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
 
         """
         (index_0) = self.validate_and_normalize_inputs(index_0)
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method(index_0).call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_by_selector(
+            ("0x1310e444", ["uint256"], ["uint256"]),
+            [index_0],
+            tx_params,
+            block_identifier,
+        )
+
+    def call_batch(
+        self, inputs: List[Tuple[int]], tx_params: Optional[TxParams] = None
+    ) -> List[int]:
+        """Execute underlying contract method via one batched eth_call.
+
+        Each element of `inputs`:code: holds the arguments to one call.  All
+        of the calls are aggregated through the Multicall3 contract, which
+        must be deployed on the network.
+
+        :param inputs: tuples of arguments, one tuple for each call
+        :param tx_params: transaction parameters
+        :returns: the return value of each call, in order.
+        """
+        tx_params = self.normalize_tx_params(tx_params)
+        contract_functions = []
+        for args in inputs:
+            (index_0) = self.validate_and_normalize_inputs(*args)
+            contract_functions.append(self.underlying_method(index_0))
+        return self.aggregate_calls(contract_functions, tx_params)
+
+    def call_async(self, index_0: int) -> Future:
+        """Execute underlying contract method via a shared, batched eth_call.
+
+        Calls made from several threads at about the same time are
+        aggregated through the Multicall3 contract, which must be deployed on
+        the network.
+
+        :returns: a :class:`concurrent.futures.Future` for the return value.
+        """
+        (index_0) = self.validate_and_normalize_inputs(index_0)
+        return self.submit_call(self.underlying_method(index_0))
 
     def send_transaction(
         self, index_0: int, tx_params: Optional[TxParams] = None
@@ -323,7 +399,7 @@ class SimpleInputSimpleOutputMethod(ContractMethod):
 
         """
         (index_0) = self.validate_and_normalize_inputs(index_0)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(index_0).transact(tx_params.as_dict())
 
     def estimate_gas(
@@ -331,7 +407,7 @@ class SimpleInputSimpleOutputMethod(ContractMethod):
     ) -> int:
         """Estimate gas consumption of method call."""
         (index_0) = self.validate_and_normalize_inputs(index_0)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(index_0).estimateGas(tx_params.as_dict())
 
 
@@ -344,9 +420,13 @@ class WithdrawMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
     def validate_and_normalize_inputs(self, wad: int):
@@ -354,21 +434,29 @@ class WithdrawMethod(ContractMethod):
         self.validator.assert_valid(
             method_name="withdraw", parameter_name="wad", argument_value=wad
         )
-        # safeguard against fractional inputs
-        wad = int(wad)
+        # safeguard against fractional inputs, skipping the common case of an
+        # exact int (but not a bool)
+        if type(wad) is not int:  # pylint: disable=unidiomatic-typecheck
+            wad = int(wad)
         return wad
 
     def call(
-        self, wad: int, tx_params: Optional[TxParams] = None
+        self,
+        wad: int,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
     ) -> Union[None, Union[HexBytes, bytes]]:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
         :returns: the return value of the underlying method.
         """
         (wad) = self.validate_and_normalize_inputs(wad)
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method(wad).call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_function(
+            self.underlying_method(wad), tx_params, block_identifier
+        )
 
     def send_transaction(
         self, wad: int, tx_params: Optional[TxParams] = None
@@ -378,15 +466,42 @@ class WithdrawMethod(ContractMethod):
         :param tx_params: transaction parameters
         """
         (wad) = self.validate_and_normalize_inputs(wad)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(wad).transact(tx_params.as_dict())
 
+    def send_transaction_batch(
+        self, inputs: List[Tuple[int]], tx_params: Optional[TxParams] = None
+    ) -> List[HexBytes]:
+        """Execute underlying contract method via batched eth_sendTransaction.
+
+        Each element of `inputs`:code: holds the arguments to one transaction.
+        The gas estimates, and then the transactions themselves, are each
+        submitted to the node in a single JSON-RPC batch, so the transactions
+        must not depend on one another.  If any of them can't be sent, a
+        :class:`zero_ex.contract_wrappers.bases.TransactionBatchError` is
+        raised, bearing the hashes of those which were.
+
+        Over an HTTP provider, the batches bypass web3's middleware, so that
+        eg signing middleware doesn't sign the transactions, which the node
+        must then sign itself.  Use `send_transaction()`:code: for those.
+
+        :param inputs: tuples of arguments, one tuple for each transaction
+        :param tx_params: transaction parameters
+        :returns: the hash of each transaction, in order.
+        """
+        tx_params = self.normalize_tx_params(tx_params)
+        contract_functions = []
+        for args in inputs:
+            (wad) = self.validate_and_normalize_inputs(*args)
+            contract_functions.append(self.underlying_method(wad))
+        return self.send_transactions(contract_functions, tx_params)
+
     def estimate_gas(
         self, wad: int, tx_params: Optional[TxParams] = None
     ) -> int:
         """Estimate gas consumption of method call."""
         (wad) = self.validate_and_normalize_inputs(wad)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(wad).estimateGas(tx_params.as_dict())
 
 
@@ -399,9 +514,13 @@ class MultiInputMultiOutputMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
     def validate_and_normalize_inputs(
@@ -413,8 +532,10 @@ class MultiInputMultiOutputMethod(ContractMethod):
             parameter_name="index_0",
             argument_value=index_0,
         )
-        # safeguard against fractional inputs
-        index_0 = int(index_0)
+        # safeguard against fractional inputs, skipping the common case of an
+        # exact int (but not a bool)
+        if type(index_0) is not int:  # pylint: disable=unidiomatic-typecheck
+            index_0 = int(index_0)
         self.validator.assert_valid(
             method_name="multiInputMultiOutput",
             parameter_name="index_1",
@@ -434,6 +555,7 @@ class MultiInputMultiOutputMethod(ContractMethod):
         index_1: bytes,
         index_2: str,
         tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
     ) -> Tuple[bytes, bytes, str]:
         """Execute underlying contract method via eth_call.
 
@@ -441,14 +563,64 @@ class MultiInputMultiOutputMethod(ContractMethod):
         one argument.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
 
         """
         (index_0, index_1, index_2) = self.validate_and_normalize_inputs(
             index_0, index_1, index_2
         )
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method(index_0, index_1, index_2).call(
-            tx_params.as_dict()
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_by_selector(
+            (
+                "0x3687617d",
+                ["uint256", "bytes", "string"],
+                ["bytes", "bytes", "string"],
+            ),
+            [index_0, index_1, index_2],
+            tx_params,
+            block_identifier,
+        )
+
+    def call_batch(
+        self,
+        inputs: List[Tuple[int, bytes, str]],
+        tx_params: Optional[TxParams] = None,
+    ) -> List[Tuple[bytes, bytes, str]]:
+        """Execute underlying contract method via one batched eth_call.
+
+        Each element of `inputs`:code: holds the arguments to one call.  All
+        of the calls are aggregated through the Multicall3 contract, which
+        must be deployed on the network.
+
+        :param inputs: tuples of arguments, one tuple for each call
+        :param tx_params: transaction parameters
+        :returns: the return value of each call, in order.
+        """
+        tx_params = self.normalize_tx_params(tx_params)
+        contract_functions = []
+        for args in inputs:
+            (index_0, index_1, index_2) = self.validate_and_normalize_inputs(
+                *args
+            )
+            contract_functions.append(
+                self.underlying_method(index_0, index_1, index_2)
+            )
+        return self.aggregate_calls(contract_functions, tx_params)
+
+    def call_async(self, index_0: int, index_1: bytes, index_2: str) -> Future:
+        """Execute underlying contract method via a shared, batched eth_call.
+
+        Calls made from several threads at about the same time are
+        aggregated through the Multicall3 contract, which must be deployed on
+        the network.
+
+        :returns: a :class:`concurrent.futures.Future` for the return value.
+        """
+        (index_0, index_1, index_2) = self.validate_and_normalize_inputs(
+            index_0, index_1, index_2
+        )
+        return self.submit_call(
+            self.underlying_method(index_0, index_1, index_2)
         )
 
     def send_transaction(
@@ -469,7 +641,7 @@ class MultiInputMultiOutputMethod(ContractMethod):
         (index_0, index_1, index_2) = self.validate_and_normalize_inputs(
             index_0, index_1, index_2
         )
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(index_0, index_1, index_2).transact(
             tx_params.as_dict()
         )
@@ -485,7 +657,7 @@ class MultiInputMultiOutputMethod(ContractMethod):
         (index_0, index_1, index_2) = self.validate_and_normalize_inputs(
             index_0, index_1, index_2
         )
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(index_0, index_1, index_2).estimateGas(
             tx_params.as_dict()
         )
@@ -500,9 +672,13 @@ class EcrecoverFnMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
     def validate_and_normalize_inputs(
@@ -532,6 +708,7 @@ class EcrecoverFnMethod(ContractMethod):
         r: bytes,
         s: bytes,
         tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
     ) -> str:
         """Execute underlying contract method via eth_call.
 
@@ -545,13 +722,57 @@ class EcrecoverFnMethod(ContractMethod):
         :param s: ECDSA s output
         :param v: some v, recovery id
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
         :returns: the signerAddress that created this signature. this line too
             is super long in order to demonstrate the proper hanging
             indentation in generated code.
         """
         (_hash, v, r, s) = self.validate_and_normalize_inputs(_hash, v, r, s)
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method(_hash, v, r, s).call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_by_selector(
+            (
+                "0x36b32396",
+                ["bytes32", "uint8", "bytes32", "bytes32"],
+                ["address"],
+            ),
+            [_hash, v, r, s],
+            tx_params,
+            block_identifier,
+        )
+
+    def call_batch(
+        self,
+        inputs: List[Tuple[bytes, int, bytes, bytes]],
+        tx_params: Optional[TxParams] = None,
+    ) -> List[str]:
+        """Execute underlying contract method via one batched eth_call.
+
+        Each element of `inputs`:code: holds the arguments to one call.  All
+        of the calls are aggregated through the Multicall3 contract, which
+        must be deployed on the network.
+
+        :param inputs: tuples of arguments, one tuple for each call
+        :param tx_params: transaction parameters
+        :returns: the return value of each call, in order.
+        """
+        tx_params = self.normalize_tx_params(tx_params)
+        contract_functions = []
+        for args in inputs:
+            (_hash, v, r, s) = self.validate_and_normalize_inputs(*args)
+            contract_functions.append(self.underlying_method(_hash, v, r, s))
+        return self.aggregate_calls(contract_functions, tx_params)
+
+    def call_async(self, _hash: bytes, v: int, r: bytes, s: bytes) -> Future:
+        """Execute underlying contract method via a shared, batched eth_call.
+
+        Calls made from several threads at about the same time are
+        aggregated through the Multicall3 contract, which must be deployed on
+        the network.
+
+        :returns: a :class:`concurrent.futures.Future` for the return value.
+        """
+        (_hash, v, r, s) = self.validate_and_normalize_inputs(_hash, v, r, s)
+        return self.submit_call(self.underlying_method(_hash, v, r, s))
 
     def send_transaction(
         self,
@@ -578,7 +799,7 @@ class EcrecoverFnMethod(ContractMethod):
             indentation in generated code.
         """
         (_hash, v, r, s) = self.validate_and_normalize_inputs(_hash, v, r, s)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(_hash, v, r, s).transact(
             tx_params.as_dict()
         )
@@ -593,7 +814,7 @@ class EcrecoverFnMethod(ContractMethod):
     ) -> int:
         """Estimate gas consumption of method call."""
         (_hash, v, r, s) = self.validate_and_normalize_inputs(_hash, v, r, s)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(_hash, v, r, s).estimateGas(
             tx_params.as_dict()
         )
@@ -608,9 +829,13 @@ class AcceptsBytesMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
     def validate_and_normalize_inputs(self, a: bytes):
@@ -621,15 +846,23 @@ class AcceptsBytesMethod(ContractMethod):
         a = bytes.fromhex(a.decode("utf-8"))
         return a
 
-    def call(self, a: bytes, tx_params: Optional[TxParams] = None) -> None:
+    def call(
+        self,
+        a: bytes,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
+    ) -> None:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
 
         """
         (a) = self.validate_and_normalize_inputs(a)
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method(a).call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_function(
+            self.underlying_method(a), tx_params, block_identifier
+        )
 
     def send_transaction(
         self, a: bytes, tx_params: Optional[TxParams] = None
@@ -640,7 +873,7 @@ class AcceptsBytesMethod(ContractMethod):
 
         """
         (a) = self.validate_and_normalize_inputs(a)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(a).transact(tx_params.as_dict())
 
     def estimate_gas(
@@ -648,7 +881,7 @@ class AcceptsBytesMethod(ContractMethod):
     ) -> int:
         """Estimate gas consumption of method call."""
         (a) = self.validate_and_normalize_inputs(a)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(a).estimateGas(tx_params.as_dict())
 
 
@@ -661,21 +894,32 @@ class NoInputSimpleOutputMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
-    def call(self, tx_params: Optional[TxParams] = None) -> int:
+    def call(
+        self,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
+    ) -> int:
         """Execute underlying contract method via eth_call.
 
         Tests decoding when input is empty and output is non-empty.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method().call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_by_selector(
+            ("0x4303a542", [], ["uint256"]), [], tx_params, block_identifier
+        )
 
     def send_transaction(
         self, tx_params: Optional[TxParams] = None
@@ -687,12 +931,12 @@ class NoInputSimpleOutputMethod(ContractMethod):
         :param tx_params: transaction parameters
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().transact(tx_params.as_dict())
 
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().estimateGas(tx_params.as_dict())
 
 
@@ -705,19 +949,30 @@ class RevertWithConstantMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
-    def call(self, tx_params: Optional[TxParams] = None) -> None:
+    def call(
+        self,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
+    ) -> None:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method().call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_function(
+            self.underlying_method(), tx_params, block_identifier
+        )
 
     def send_transaction(
         self, tx_params: Optional[TxParams] = None
@@ -727,12 +982,12 @@ class RevertWithConstantMethod(ContractMethod):
         :param tx_params: transaction parameters
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().transact(tx_params.as_dict())
 
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().estimateGas(tx_params.as_dict())
 
 
@@ -745,19 +1000,30 @@ class SimpleRevertMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
-    def call(self, tx_params: Optional[TxParams] = None) -> None:
+    def call(
+        self,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
+    ) -> None:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method().call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_function(
+            self.underlying_method(), tx_params, block_identifier
+        )
 
     def send_transaction(
         self, tx_params: Optional[TxParams] = None
@@ -767,12 +1033,12 @@ class SimpleRevertMethod(ContractMethod):
         :param tx_params: transaction parameters
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().transact(tx_params.as_dict())
 
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().estimateGas(tx_params.as_dict())
 
 
@@ -787,19 +1053,30 @@ class MethodUsingNestedStructWithInnerStructNotUsedElsewhereMethod(
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
-    def call(self, tx_params: Optional[TxParams] = None) -> Tuple0x1b9da225:
+    def call(
+        self,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
+    ) -> Tuple0x1b9da225:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method().call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_function(
+            self.underlying_method(), tx_params, block_identifier
+        )
 
     def send_transaction(
         self, tx_params: Optional[TxParams] = None
@@ -809,12 +1086,12 @@ class MethodUsingNestedStructWithInnerStructNotUsedElsewhereMethod(
         :param tx_params: transaction parameters
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().transact(tx_params.as_dict())
 
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().estimateGas(tx_params.as_dict())
 
 
@@ -827,19 +1104,30 @@ class NestedStructOutputMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
-    def call(self, tx_params: Optional[TxParams] = None) -> Tuple0xc9bdd2d5:
+    def call(
+        self,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
+    ) -> Tuple0xc9bdd2d5:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method().call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_function(
+            self.underlying_method(), tx_params, block_identifier
+        )
 
     def send_transaction(
         self, tx_params: Optional[TxParams] = None
@@ -849,12 +1137,12 @@ class NestedStructOutputMethod(ContractMethod):
         :param tx_params: transaction parameters
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().transact(tx_params.as_dict())
 
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().estimateGas(tx_params.as_dict())
 
 
@@ -867,19 +1155,30 @@ class RequireWithConstantMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
-    def call(self, tx_params: Optional[TxParams] = None) -> None:
+    def call(
+        self,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
+    ) -> None:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method().call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_function(
+            self.underlying_method(), tx_params, block_identifier
+        )
 
     def send_transaction(
         self, tx_params: Optional[TxParams] = None
@@ -889,12 +1188,12 @@ class RequireWithConstantMethod(ContractMethod):
         :param tx_params: transaction parameters
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().transact(tx_params.as_dict())
 
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().estimateGas(tx_params.as_dict())
 
 
@@ -907,9 +1206,13 @@ class WithAddressInputMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
     def validate_and_normalize_inputs(
@@ -927,15 +1230,19 @@ class WithAddressInputMethod(ContractMethod):
             parameter_name="a",
             argument_value=a,
         )
-        # safeguard against fractional inputs
-        a = int(a)
+        # safeguard against fractional inputs, skipping the common case of an
+        # exact int (but not a bool)
+        if type(a) is not int:  # pylint: disable=unidiomatic-typecheck
+            a = int(a)
         self.validator.assert_valid(
             method_name="withAddressInput",
             parameter_name="b",
             argument_value=b,
         )
-        # safeguard against fractional inputs
-        b = int(b)
+        # safeguard against fractional inputs, skipping the common case of an
+        # exact int (but not a bool)
+        if type(b) is not int:  # pylint: disable=unidiomatic-typecheck
+            b = int(b)
         self.validator.assert_valid(
             method_name="withAddressInput",
             parameter_name="y",
@@ -947,8 +1254,10 @@ class WithAddressInputMethod(ContractMethod):
             parameter_name="c",
             argument_value=c,
         )
-        # safeguard against fractional inputs
-        c = int(c)
+        # safeguard against fractional inputs, skipping the common case of an
+        # exact int (but not a bool)
+        if type(c) is not int:  # pylint: disable=unidiomatic-typecheck
+            c = int(c)
         return (x, a, b, y, c)
 
     def call(
@@ -959,15 +1268,60 @@ class WithAddressInputMethod(ContractMethod):
         y: str,
         c: int,
         tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
     ) -> str:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
+
+        """
+        (x, a, b, y, c) = self.validate_and_normalize_inputs(x, a, b, y, c)
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_by_selector(
+            (
+                "0x63d69c88",
+                ["address", "uint256", "uint256", "address", "uint256"],
+                ["address"],
+            ),
+            [x, a, b, y, c],
+            tx_params,
+            block_identifier,
+        )
+
+    def call_batch(
+        self,
+        inputs: List[Tuple[str, int, int, str, int]],
+        tx_params: Optional[TxParams] = None,
+    ) -> List[str]:
+        """Execute underlying contract method via one batched eth_call.
+
+        Each element of `inputs`:code: holds the arguments to one call.  All
+        of the calls are aggregated through the Multicall3 contract, which
+        must be deployed on the network.
+
+        :param inputs: tuples of arguments, one tuple for each call
+        :param tx_params: transaction parameters
+        :returns: the return value of each call, in order.
+        """
+        tx_params = self.normalize_tx_params(tx_params)
+        contract_functions = []
+        for args in inputs:
+            (x, a, b, y, c) = self.validate_and_normalize_inputs(*args)
+            contract_functions.append(self.underlying_method(x, a, b, y, c))
+        return self.aggregate_calls(contract_functions, tx_params)
 
+    def call_async(self, x: str, a: int, b: int, y: str, c: int) -> Future:
+        """Execute underlying contract method via a shared, batched eth_call.
+
+        Calls made from several threads at about the same time are
+        aggregated through the Multicall3 contract, which must be deployed on
+        the network.
+
+        :returns: a :class:`concurrent.futures.Future` for the return value.
         """
         (x, a, b, y, c) = self.validate_and_normalize_inputs(x, a, b, y, c)
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method(x, a, b, y, c).call(tx_params.as_dict())
+        return self.submit_call(self.underlying_method(x, a, b, y, c))
 
     def send_transaction(
         self,
@@ -984,7 +1338,7 @@ class WithAddressInputMethod(ContractMethod):
 
         """
         (x, a, b, y, c) = self.validate_and_normalize_inputs(x, a, b, y, c)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(x, a, b, y, c).transact(
             tx_params.as_dict()
         )
@@ -1000,7 +1354,7 @@ class WithAddressInputMethod(ContractMethod):
     ) -> int:
         """Estimate gas consumption of method call."""
         (x, a, b, y, c) = self.validate_and_normalize_inputs(x, a, b, y, c)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(x, a, b, y, c).estimateGas(
             tx_params.as_dict()
         )
@@ -1015,9 +1369,13 @@ class StructInputMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
     def validate_and_normalize_inputs(self, s: Tuple0xcf8ad995):
@@ -1028,16 +1386,22 @@ class StructInputMethod(ContractMethod):
         return s
 
     def call(
-        self, s: Tuple0xcf8ad995, tx_params: Optional[TxParams] = None
+        self,
+        s: Tuple0xcf8ad995,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
     ) -> None:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
 
         """
         (s) = self.validate_and_normalize_inputs(s)
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method(s).call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_function(
+            self.underlying_method(s), tx_params, block_identifier
+        )
 
     def send_transaction(
         self, s: Tuple0xcf8ad995, tx_params: Optional[TxParams] = None
@@ -1048,7 +1412,7 @@ class StructInputMethod(ContractMethod):
 
         """
         (s) = self.validate_and_normalize_inputs(s)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(s).transact(tx_params.as_dict())
 
     def estimate_gas(
@@ -1056,7 +1420,7 @@ class StructInputMethod(ContractMethod):
     ) -> int:
         """Estimate gas consumption of method call."""
         (s) = self.validate_and_normalize_inputs(s)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(s).estimateGas(tx_params.as_dict())
 
 
@@ -1069,21 +1433,30 @@ class NonPureMethodMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
     def call(
-        self, tx_params: Optional[TxParams] = None
+        self,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
     ) -> Union[int, Union[HexBytes, bytes]]:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
         :returns: the return value of the underlying method.
         """
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method().call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_function(
+            self.underlying_method(), tx_params, block_identifier
+        )
 
     def send_transaction(
         self, tx_params: Optional[TxParams] = None
@@ -1092,12 +1465,12 @@ class NonPureMethodMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().transact(tx_params.as_dict())
 
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().estimateGas(tx_params.as_dict())
 
 
@@ -1110,9 +1483,13 @@ class ComplexInputComplexOutputMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
     def validate_and_normalize_inputs(self, complex_input: Tuple0xf95128ef):
@@ -1128,17 +1505,55 @@ class ComplexInputComplexOutputMethod(ContractMethod):
         self,
         complex_input: Tuple0xf95128ef,
         tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
     ) -> Tuple0xa057bf41:
         """Execute underlying contract method via eth_call.
 
         Tests decoding when the input and output are complex.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
+
+        """
+        (complex_input) = self.validate_and_normalize_inputs(complex_input)
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_function(
+            self.underlying_method(complex_input), tx_params, block_identifier
+        )
+
+    def call_batch(
+        self,
+        inputs: List[Tuple[Tuple0xf95128ef]],
+        tx_params: Optional[TxParams] = None,
+    ) -> List[Tuple0xa057bf41]:
+        """Execute underlying contract method via one batched eth_call.
+
+        Each element of `inputs`:code: holds the arguments to one call.  All
+        of the calls are aggregated through the Multicall3 contract, which
+        must be deployed on the network.
+
+        :param inputs: tuples of arguments, one tuple for each call
+        :param tx_params: transaction parameters
+        :returns: the return value of each call, in order.
+        """
+        tx_params = self.normalize_tx_params(tx_params)
+        contract_functions = []
+        for args in inputs:
+            (complex_input) = self.validate_and_normalize_inputs(*args)
+            contract_functions.append(self.underlying_method(complex_input))
+        return self.aggregate_calls(contract_functions, tx_params)
+
+    def call_async(self, complex_input: Tuple0xf95128ef) -> Future:
+        """Execute underlying contract method via a shared, batched eth_call.
+
+        Calls made from several threads at about the same time are
+        aggregated through the Multicall3 contract, which must be deployed on
+        the network.
 
+        :returns: a :class:`concurrent.futures.Future` for the return value.
         """
         (complex_input) = self.validate_and_normalize_inputs(complex_input)
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method(complex_input).call(tx_params.as_dict())
+        return self.submit_call(self.underlying_method(complex_input))
 
     def send_transaction(
         self,
@@ -1153,7 +1568,7 @@ class ComplexInputComplexOutputMethod(ContractMethod):
 
         """
         (complex_input) = self.validate_and_normalize_inputs(complex_input)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(complex_input).transact(
             tx_params.as_dict()
         )
@@ -1165,7 +1580,7 @@ class ComplexInputComplexOutputMethod(ContractMethod):
     ) -> int:
         """Estimate gas consumption of method call."""
         (complex_input) = self.validate_and_normalize_inputs(complex_input)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(complex_input).estimateGas(
             tx_params.as_dict()
         )
@@ -1180,21 +1595,32 @@ class NoInputNoOutputMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
-    def call(self, tx_params: Optional[TxParams] = None) -> None:
+    def call(
+        self,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
+    ) -> None:
         """Execute underlying contract method via eth_call.
 
         Tests decoding when both input and output are empty.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method().call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_function(
+            self.underlying_method(), tx_params, block_identifier
+        )
 
     def send_transaction(
         self, tx_params: Optional[TxParams] = None
@@ -1206,12 +1632,12 @@ class NoInputNoOutputMethod(ContractMethod):
         :param tx_params: transaction parameters
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().transact(tx_params.as_dict())
 
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().estimateGas(tx_params.as_dict())
 
 
@@ -1224,9 +1650,13 @@ class SimplePureFunctionWithInputMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
     def validate_and_normalize_inputs(self, x: int):
@@ -1236,19 +1666,64 @@ class SimplePureFunctionWithInputMethod(ContractMethod):
             parameter_name="x",
             argument_value=x,
         )
-        # safeguard against fractional inputs
-        x = int(x)
+        # safeguard against fractional inputs, skipping the common case of an
+        # exact int (but not a bool)
+        if type(x) is not int:  # pylint: disable=unidiomatic-typecheck
+            x = int(x)
         return x
 
-    def call(self, x: int, tx_params: Optional[TxParams] = None) -> int:
+    def call(
+        self,
+        x: int,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
+    ) -> int:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
+
+        """
+        (x) = self.validate_and_normalize_inputs(x)
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_by_selector(
+            ("0x8ee52b4e", ["uint256"], ["uint256"]),
+            [x],
+            tx_params,
+            block_identifier,
+        )
+
+    def call_batch(
+        self, inputs: List[Tuple[int]], tx_params: Optional[TxParams] = None
+    ) -> List[int]:
+        """Execute underlying contract method via one batched eth_call.
+
+        Each element of `inputs`:code: holds the arguments to one call.  All
+        of the calls are aggregated through the Multicall3 contract, which
+        must be deployed on the network.
+
+        :param inputs: tuples of arguments, one tuple for each call
+        :param tx_params: transaction parameters
+        :returns: the return value of each call, in order.
+        """
+        tx_params = self.normalize_tx_params(tx_params)
+        contract_functions = []
+        for args in inputs:
+            (x) = self.validate_and_normalize_inputs(*args)
+            contract_functions.append(self.underlying_method(x))
+        return self.aggregate_calls(contract_functions, tx_params)
+
+    def call_async(self, x: int) -> Future:
+        """Execute underlying contract method via a shared, batched eth_call.
+
+        Calls made from several threads at about the same time are
+        aggregated through the Multicall3 contract, which must be deployed on
+        the network.
 
+        :returns: a :class:`concurrent.futures.Future` for the return value.
         """
         (x) = self.validate_and_normalize_inputs(x)
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method(x).call(tx_params.as_dict())
+        return self.submit_call(self.underlying_method(x))
 
     def send_transaction(
         self, x: int, tx_params: Optional[TxParams] = None
@@ -1259,7 +1734,7 @@ class SimplePureFunctionWithInputMethod(ContractMethod):
 
         """
         (x) = self.validate_and_normalize_inputs(x)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(x).transact(tx_params.as_dict())
 
     def estimate_gas(
@@ -1267,7 +1742,7 @@ class SimplePureFunctionWithInputMethod(ContractMethod):
     ) -> int:
         """Estimate gas consumption of method call."""
         (x) = self.validate_and_normalize_inputs(x)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(x).estimateGas(tx_params.as_dict())
 
 
@@ -1280,21 +1755,30 @@ class NonPureMethodThatReturnsNothingMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
     def call(
-        self, tx_params: Optional[TxParams] = None
+        self,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
     ) -> Union[None, Union[HexBytes, bytes]]:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
         :returns: the return value of the underlying method.
         """
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method().call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_function(
+            self.underlying_method(), tx_params, block_identifier
+        )
 
     def send_transaction(
         self, tx_params: Optional[TxParams] = None
@@ -1303,12 +1787,12 @@ class NonPureMethodThatReturnsNothingMethod(ContractMethod):
 
         :param tx_params: transaction parameters
         """
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().transact(tx_params.as_dict())
 
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().estimateGas(tx_params.as_dict())
 
 
@@ -1321,19 +1805,30 @@ class SimplePureFunctionMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
-    def call(self, tx_params: Optional[TxParams] = None) -> int:
+    def call(
+        self,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
+    ) -> int:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method().call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_by_selector(
+            ("0xa3c2f6b6", [], ["uint256"]), [], tx_params, block_identifier
+        )
 
     def send_transaction(
         self, tx_params: Optional[TxParams] = None
@@ -1343,12 +1838,12 @@ class SimplePureFunctionMethod(ContractMethod):
         :param tx_params: transaction parameters
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().transact(tx_params.as_dict())
 
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().estimateGas(tx_params.as_dict())
 
 
@@ -1361,9 +1856,13 @@ class NestedStructInputMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
     def validate_and_normalize_inputs(self, n: Tuple0xc9bdd2d5):
@@ -1376,16 +1875,22 @@ class NestedStructInputMethod(ContractMethod):
         return n
 
     def call(
-        self, n: Tuple0xc9bdd2d5, tx_params: Optional[TxParams] = None
+        self,
+        n: Tuple0xc9bdd2d5,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
     ) -> None:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
 
         """
         (n) = self.validate_and_normalize_inputs(n)
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method(n).call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_function(
+            self.underlying_method(n), tx_params, block_identifier
+        )
 
     def send_transaction(
         self, n: Tuple0xc9bdd2d5, tx_params: Optional[TxParams] = None
@@ -1396,7 +1901,7 @@ class NestedStructInputMethod(ContractMethod):
 
         """
         (n) = self.validate_and_normalize_inputs(n)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(n).transact(tx_params.as_dict())
 
     def estimate_gas(
@@ -1404,7 +1909,7 @@ class NestedStructInputMethod(ContractMethod):
     ) -> int:
         """Estimate gas consumption of method call."""
         (n) = self.validate_and_normalize_inputs(n)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(n).estimateGas(tx_params.as_dict())
 
 
@@ -1417,19 +1922,33 @@ class MethodReturningMultipleValuesMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
-    def call(self, tx_params: Optional[TxParams] = None) -> Tuple[int, str]:
+    def call(
+        self,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
+    ) -> Tuple[int, str]:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method().call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_by_selector(
+            ("0xbb607362", [], ["uint256", "string"]),
+            [],
+            tx_params,
+            block_identifier,
+        )
 
     def send_transaction(
         self, tx_params: Optional[TxParams] = None
@@ -1439,12 +1958,12 @@ class MethodReturningMultipleValuesMethod(ContractMethod):
         :param tx_params: transaction parameters
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().transact(tx_params.as_dict())
 
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().estimateGas(tx_params.as_dict())
 
 
@@ -1457,21 +1976,30 @@ class MethodReturningArrayOfStructsMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
     def call(
-        self, tx_params: Optional[TxParams] = None
+        self,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
     ) -> List[Tuple0xcf8ad995]:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method().call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_function(
+            self.underlying_method(), tx_params, block_identifier
+        )
 
     def send_transaction(
         self, tx_params: Optional[TxParams] = None
@@ -1481,12 +2009,12 @@ class MethodReturningArrayOfStructsMethod(ContractMethod):
         :param tx_params: transaction parameters
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().transact(tx_params.as_dict())
 
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().estimateGas(tx_params.as_dict())
 
 
@@ -1499,21 +2027,32 @@ class StructOutputMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
-    def call(self, tx_params: Optional[TxParams] = None) -> Tuple0xcf8ad995:
+    def call(
+        self,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
+    ) -> Tuple0xcf8ad995:
         """Execute underlying contract method via eth_call.
 
         a method that returns a struct
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
         :returns: a Struct struct
         """
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method().call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_function(
+            self.underlying_method(), tx_params, block_identifier
+        )
 
     def send_transaction(
         self, tx_params: Optional[TxParams] = None
@@ -1525,12 +2064,12 @@ class StructOutputMethod(ContractMethod):
         :param tx_params: transaction parameters
         :returns: a Struct struct
         """
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().transact(tx_params.as_dict())
 
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().estimateGas(tx_params.as_dict())
 
 
@@ -1543,19 +2082,30 @@ class PureFunctionWithConstantMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
-    def call(self, tx_params: Optional[TxParams] = None) -> int:
+    def call(
+        self,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
+    ) -> int:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method().call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_by_selector(
+            ("0xd88be12f", [], ["uint256"]), [], tx_params, block_identifier
+        )
 
     def send_transaction(
         self, tx_params: Optional[TxParams] = None
@@ -1565,12 +2115,12 @@ class PureFunctionWithConstantMethod(ContractMethod):
         :param tx_params: transaction parameters
 
         """
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().transact(tx_params.as_dict())
 
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method().estimateGas(tx_params.as_dict())
 
 
@@ -1583,9 +2133,13 @@ class SimpleInputNoOutputMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
     def validate_and_normalize_inputs(self, index_0: int):
@@ -1595,21 +2149,31 @@ class SimpleInputNoOutputMethod(ContractMethod):
             parameter_name="index_0",
             argument_value=index_0,
         )
-        # safeguard against fractional inputs
-        index_0 = int(index_0)
+        # safeguard against fractional inputs, skipping the common case of an
+        # exact int (but not a bool)
+        if type(index_0) is not int:  # pylint: disable=unidiomatic-typecheck
+            index_0 = int(index_0)
         return index_0
 
-    def call(self, index_0: int, tx_params: Optional[TxParams] = None) -> None:
+    def call(
+        self,
+        index_0: int,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
+    ) -> None:
         """Execute underlying contract method via eth_call.
 
         Tests decoding when input is not empty but output is empty.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
 
         """
         (index_0) = self.validate_and_normalize_inputs(index_0)
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method(index_0).call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_function(
+            self.underlying_method(index_0), tx_params, block_identifier
+        )
 
     def send_transaction(
         self, index_0: int, tx_params: Optional[TxParams] = None
@@ -1622,7 +2186,7 @@ class SimpleInputNoOutputMethod(ContractMethod):
 
         """
         (index_0) = self.validate_and_normalize_inputs(index_0)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(index_0).transact(tx_params.as_dict())
 
     def estimate_gas(
@@ -1630,7 +2194,7 @@ class SimpleInputNoOutputMethod(ContractMethod):
     ) -> int:
         """Estimate gas consumption of method call."""
         (index_0) = self.validate_and_normalize_inputs(index_0)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(index_0).estimateGas(tx_params.as_dict())
 
 
@@ -1643,9 +2207,13 @@ class OverloadedMethod2Method(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
     def validate_and_normalize_inputs(self, a: str):
@@ -1657,15 +2225,23 @@ class OverloadedMethod2Method(ContractMethod):
         )
         return a
 
-    def call(self, a: str, tx_params: Optional[TxParams] = None) -> None:
+    def call(
+        self,
+        a: str,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
+    ) -> None:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
 
         """
         (a) = self.validate_and_normalize_inputs(a)
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method(a).call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_function(
+            self.underlying_method(a), tx_params, block_identifier
+        )
 
     def send_transaction(
         self, a: str, tx_params: Optional[TxParams] = None
@@ -1676,7 +2252,7 @@ class OverloadedMethod2Method(ContractMethod):
 
         """
         (a) = self.validate_and_normalize_inputs(a)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(a).transact(tx_params.as_dict())
 
     def estimate_gas(
@@ -1684,7 +2260,7 @@ class OverloadedMethod2Method(ContractMethod):
     ) -> int:
         """Estimate gas consumption of method call."""
         (a) = self.validate_and_normalize_inputs(a)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(a).estimateGas(tx_params.as_dict())
 
 
@@ -1697,9 +2273,13 @@ class OverloadedMethod1Method(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
     def validate_and_normalize_inputs(self, a: int):
@@ -1711,15 +2291,23 @@ class OverloadedMethod1Method(ContractMethod):
         )
         return a
 
-    def call(self, a: int, tx_params: Optional[TxParams] = None) -> None:
+    def call(
+        self,
+        a: int,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
+    ) -> None:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
 
         """
         (a) = self.validate_and_normalize_inputs(a)
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method(a).call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_function(
+            self.underlying_method(a), tx_params, block_identifier
+        )
 
     def send_transaction(
         self, a: int, tx_params: Optional[TxParams] = None
@@ -1730,7 +2318,7 @@ class OverloadedMethod1Method(ContractMethod):
 
         """
         (a) = self.validate_and_normalize_inputs(a)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(a).transact(tx_params.as_dict())
 
     def estimate_gas(
@@ -1738,10 +2326,617 @@ class OverloadedMethod1Method(ContractMethod):
     ) -> int:
         """Estimate gas consumption of method call."""
         (a) = self.validate_and_normalize_inputs(a)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(a).estimateGas(tx_params.as_dict())
 
 
+_ABI: List[Dict[str, Any]] = [
+    {
+        "constant": True,
+        "inputs": [],
+        "name": "simpleRequire",
+        "outputs": [],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [
+            {"internalType": "bytes[]", "name": "a", "type": "bytes[]"}
+        ],
+        "name": "acceptsAnArrayOfBytes",
+        "outputs": [],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [
+            {"internalType": "uint256", "name": "index_0", "type": "uint256"}
+        ],
+        "name": "simpleInputSimpleOutput",
+        "outputs": [
+            {"internalType": "uint256", "name": "", "type": "uint256"}
+        ],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": False,
+        "inputs": [
+            {"internalType": "uint256", "name": "wad", "type": "uint256"}
+        ],
+        "name": "withdraw",
+        "outputs": [],
+        "payable": False,
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [
+            {"internalType": "uint256", "name": "index_0", "type": "uint256"},
+            {"internalType": "bytes", "name": "index_1", "type": "bytes"},
+            {"internalType": "string", "name": "index_2", "type": "string"},
+        ],
+        "name": "multiInputMultiOutput",
+        "outputs": [
+            {"internalType": "bytes", "name": "", "type": "bytes"},
+            {"internalType": "bytes", "name": "", "type": "bytes"},
+            {"internalType": "string", "name": "", "type": "string"},
+        ],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [
+            {"internalType": "bytes32", "name": "hash", "type": "bytes32"},
+            {"internalType": "uint8", "name": "v", "type": "uint8"},
+            {"internalType": "bytes32", "name": "r", "type": "bytes32"},
+            {"internalType": "bytes32", "name": "s", "type": "bytes32"},
+        ],
+        "name": "ecrecoverFn",
+        "outputs": [
+            {
+                "internalType": "address",
+                "name": "signerAddress",
+                "type": "address",
+            }
+        ],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [{"internalType": "bytes", "name": "a", "type": "bytes"}],
+        "name": "acceptsBytes",
+        "outputs": [],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [],
+        "name": "noInputSimpleOutput",
+        "outputs": [
+            {"internalType": "uint256", "name": "", "type": "uint256"}
+        ],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [],
+        "name": "revertWithConstant",
+        "outputs": [],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [],
+        "name": "simpleRevert",
+        "outputs": [],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [],
+        "name": "methodUsingNestedStructWithInnerStructNotUsedElsewhere",
+        "outputs": [
+            {
+                "components": [
+                    {
+                        "components": [
+                            {
+                                "internalType": "uint256",
+                                "name": "aField",
+                                "type": "uint256",
+                            }
+                        ],
+                        "internalType": "struct AbiGenDummy.StructNotDirectlyUsedAnywhere",
+                        "name": "innerStruct",
+                        "type": "tuple",
+                    }
+                ],
+                "internalType": "struct AbiGenDummy.NestedStructWithInnerStructNotUsedElsewhere",
+                "name": "",
+                "type": "tuple",
+            }
+        ],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [],
+        "name": "nestedStructOutput",
+        "outputs": [
+            {
+                "components": [
+                    {
+                        "components": [
+                            {
+                                "internalType": "bytes",
+                                "name": "someBytes",
+                                "type": "bytes",
+                            },
+                            {
+                                "internalType": "uint32",
+                                "name": "anInteger",
+                                "type": "uint32",
+                            },
+                            {
+                                "internalType": "bytes[]",
+                                "name": "aDynamicArrayOfBytes",
+                                "type": "bytes[]",
+                            },
+                            {
+                                "internalType": "string",
+                                "name": "aString",
+                                "type": "string",
+                            },
+                        ],
+                        "internalType": "struct AbiGenDummy.Struct",
+                        "name": "innerStruct",
+                        "type": "tuple",
+                    },
+                    {
+                        "internalType": "string",
+                        "name": "description",
+                        "type": "string",
+                    },
+                ],
+                "internalType": "struct AbiGenDummy.NestedStruct",
+                "name": "",
+                "type": "tuple",
+            }
+        ],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [],
+        "name": "requireWithConstant",
+        "outputs": [],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [
+            {"internalType": "address", "name": "x", "type": "address"},
+            {"internalType": "uint256", "name": "a", "type": "uint256"},
+            {"internalType": "uint256", "name": "b", "type": "uint256"},
+            {"internalType": "address", "name": "y", "type": "address"},
+            {"internalType": "uint256", "name": "c", "type": "uint256"},
+        ],
+        "name": "withAddressInput",
+        "outputs": [
+            {"internalType": "address", "name": "z", "type": "address"}
+        ],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [
+            {
+                "components": [
+                    {
+                        "internalType": "bytes",
+                        "name": "someBytes",
+                        "type": "bytes",
+                    },
+                    {
+                        "internalType": "uint32",
+                        "name": "anInteger",
+                        "type": "uint32",
+                    },
+                    {
+                        "internalType": "bytes[]",
+                        "name": "aDynamicArrayOfBytes",
+                        "type": "bytes[]",
+                    },
+                    {
+                        "internalType": "string",
+                        "name": "aString",
+                        "type": "string",
+                    },
+                ],
+                "internalType": "struct AbiGenDummy.Struct",
+                "name": "s",
+                "type": "tuple",
+            }
+        ],
+        "name": "structInput",
+        "outputs": [],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": False,
+        "inputs": [],
+        "name": "nonPureMethod",
+        "outputs": [
+            {"internalType": "uint256", "name": "", "type": "uint256"}
+        ],
+        "payable": False,
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [
+            {
+                "components": [
+                    {
+                        "internalType": "uint256",
+                        "name": "foo",
+                        "type": "uint256",
+                    },
+                    {"internalType": "bytes", "name": "bar", "type": "bytes"},
+                    {
+                        "internalType": "string",
+                        "name": "car",
+                        "type": "string",
+                    },
+                ],
+                "internalType": "struct AbiGenDummy.ComplexInput",
+                "name": "complexInput",
+                "type": "tuple",
+            }
+        ],
+        "name": "complexInputComplexOutput",
+        "outputs": [
+            {
+                "components": [
+                    {
+                        "components": [
+                            {
+                                "internalType": "uint256",
+                                "name": "foo",
+                                "type": "uint256",
+                            },
+                            {
+                                "internalType": "bytes",
+                                "name": "bar",
+                                "type": "bytes",
+                            },
+                            {
+                                "internalType": "string",
+                                "name": "car",
+                                "type": "string",
+                            },
+                        ],
+                        "internalType": "struct AbiGenDummy.ComplexInput",
+                        "name": "input",
+                        "type": "tuple",
+                    },
+                    {
+                        "internalType": "bytes",
+                        "name": "lorem",
+                        "type": "bytes",
+                    },
+                    {
+                        "internalType": "bytes",
+                        "name": "ipsum",
+                        "type": "bytes",
+                    },
+                    {
+                        "internalType": "string",
+                        "name": "dolor",
+                        "type": "string",
+                    },
+                ],
+                "internalType": "struct AbiGenDummy.ComplexOutput",
+                "name": "",
+                "type": "tuple",
+            }
+        ],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [],
+        "name": "noInputNoOutput",
+        "outputs": [],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [
+            {"internalType": "uint256", "name": "x", "type": "uint256"}
+        ],
+        "name": "simplePureFunctionWithInput",
+        "outputs": [
+            {"internalType": "uint256", "name": "sum", "type": "uint256"}
+        ],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": False,
+        "inputs": [],
+        "name": "nonPureMethodThatReturnsNothing",
+        "outputs": [],
+        "payable": False,
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [],
+        "name": "simplePureFunction",
+        "outputs": [
+            {"internalType": "uint256", "name": "result", "type": "uint256"}
+        ],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [
+            {
+                "components": [
+                    {
+                        "components": [
+                            {
+                                "internalType": "bytes",
+                                "name": "someBytes",
+                                "type": "bytes",
+                            },
+                            {
+                                "internalType": "uint32",
+                                "name": "anInteger",
+                                "type": "uint32",
+                            },
+                            {
+                                "internalType": "bytes[]",
+                                "name": "aDynamicArrayOfBytes",
+                                "type": "bytes[]",
+                            },
+                            {
+                                "internalType": "string",
+                                "name": "aString",
+                                "type": "string",
+                            },
+                        ],
+                        "internalType": "struct AbiGenDummy.Struct",
+                        "name": "innerStruct",
+                        "type": "tuple",
+                    },
+                    {
+                        "internalType": "string",
+                        "name": "description",
+                        "type": "string",
+                    },
+                ],
+                "internalType": "struct AbiGenDummy.NestedStruct",
+                "name": "n",
+                "type": "tuple",
+            }
+        ],
+        "name": "nestedStructInput",
+        "outputs": [],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [],
+        "name": "methodReturningMultipleValues",
+        "outputs": [
+            {"internalType": "uint256", "name": "", "type": "uint256"},
+            {"internalType": "string", "name": "", "type": "string"},
+        ],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [],
+        "name": "methodReturningArrayOfStructs",
+        "outputs": [
+            {
+                "components": [
+                    {
+                        "internalType": "bytes",
+                        "name": "someBytes",
+                        "type": "bytes",
+                    },
+                    {
+                        "internalType": "uint32",
+                        "name": "anInteger",
+                        "type": "uint32",
+                    },
+                    {
+                        "internalType": "bytes[]",
+                        "name": "aDynamicArrayOfBytes",
+                        "type": "bytes[]",
+                    },
+                    {
+                        "internalType": "string",
+                        "name": "aString",
+                        "type": "string",
+                    },
+                ],
+                "internalType": "struct AbiGenDummy.Struct[]",
+                "name": "",
+                "type": "tuple[]",
+            }
+        ],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [],
+        "name": "structOutput",
+        "outputs": [
+            {
+                "components": [
+                    {
+                        "internalType": "bytes",
+                        "name": "someBytes",
+                        "type": "bytes",
+                    },
+                    {
+                        "internalType": "uint32",
+                        "name": "anInteger",
+                        "type": "uint32",
+                    },
+                    {
+                        "internalType": "bytes[]",
+                        "name": "aDynamicArrayOfBytes",
+                        "type": "bytes[]",
+                    },
+                    {
+                        "internalType": "string",
+                        "name": "aString",
+                        "type": "string",
+                    },
+                ],
+                "internalType": "struct AbiGenDummy.Struct",
+                "name": "s",
+                "type": "tuple",
+            }
+        ],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [],
+        "name": "pureFunctionWithConstant",
+        "outputs": [
+            {
+                "internalType": "uint256",
+                "name": "someConstant",
+                "type": "uint256",
+            }
+        ],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [
+            {"internalType": "uint256", "name": "index_0", "type": "uint256"}
+        ],
+        "name": "simpleInputNoOutput",
+        "outputs": [],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [{"internalType": "string", "name": "a", "type": "string"}],
+        "name": "overloadedMethod",
+        "outputs": [],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [{"internalType": "int256", "name": "a", "type": "int256"}],
+        "name": "overloadedMethod",
+        "outputs": [],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {
+                "indexed": True,
+                "internalType": "address",
+                "name": "_owner",
+                "type": "address",
+            },
+            {
+                "indexed": False,
+                "internalType": "uint256",
+                "name": "_value",
+                "type": "uint256",
+            },
+        ],
+        "name": "Withdrawal",
+        "type": "event",
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {
+                "indexed": False,
+                "internalType": "uint8",
+                "name": "param",
+                "type": "uint8",
+            }
+        ],
+        "name": "AnEvent",
+        "type": "event",
+    },
+]
+
+_EVENT_TOPICS = {
+    abi["name"]: event_abi_to_log_topic(abi)
+    for abi in _ABI
+    if abi["type"] == "event" and not abi.get("anonymous")
+}
+
+
 # pylint: disable=too-many-public-methods,too-many-instance-attributes
 class AbiGenDummy:
     """Wrapper class for AbiGenDummy Solidity contract.
@@ -1750,6 +2945,9 @@ class AbiGenDummy:
     which can be accomplished via `str.encode("utf_8")`:code:.
     """
 
+    ABI: List[Dict[str, Any]] = _ABI
+    """ABI of the underlying contract."""
+
     simple_require: SimpleRequireMethod
     """Constructor-initialized instance of
     :class:`SimpleRequireMethod`.
@@ -1900,12 +3098,16 @@ class AbiGenDummy:
         provider: BaseProvider,
         contract_address: str,
         validator: AbiGenDummyValidator = None,
+        cache: Optional[MutableMapping] = None,
     ):
         """Get an instance of wrapper for smart contract.
 
         :param provider: instance of :class:`web3.providers.base.BaseProvider`
         :param contract_address: where the contract has been deployed
         :param validator: for validation of method inputs.
+        :param cache: optional mapping in which to keep the results of
+            read-only calls made at a specific block number or hash, so that
+            repeating such a call doesn't query the node again.
         """
         self.contract_address = contract_address
 
@@ -1916,13 +3118,22 @@ class AbiGenDummy:
             provider
         ).eth
 
-        functions = self._web3_eth.contract(
-            address=to_checksum_address(contract_address),
-            abi=AbiGenDummy.abi(),
-        ).functions
+        self._contract = self._web3_eth.contract(
+            address=to_checksum_address(contract_address), abi=AbiGenDummy.ABI
+        )
+
+        functions = self._contract.functions
+        # shared, so that concurrent call_async()s of different methods can be
+        # aggregated together
+        batch_scheduler = BatchScheduler()
 
         self.simple_require = SimpleRequireMethod(
-            provider, contract_address, functions.simpleRequire, validator
+            provider,
+            contract_address,
+            functions.simpleRequire,
+            validator,
+            cache,
+            batch_scheduler,
         )
 
         self.accepts_an_array_of_bytes = AcceptsAnArrayOfBytesMethod(
@@ -1930,6 +3141,8 @@ class AbiGenDummy:
             contract_address,
             functions.acceptsAnArrayOfBytes,
             validator,
+            cache,
+            batch_scheduler,
         )
 
         self.simple_input_simple_output = SimpleInputSimpleOutputMethod(
@@ -1937,10 +3150,17 @@ class AbiGenDummy:
             contract_address,
             functions.simpleInputSimpleOutput,
             validator,
+            cache,
+            batch_scheduler,
         )
 
         self.withdraw = WithdrawMethod(
-            provider, contract_address, functions.withdraw, validator
+            provider,
+            contract_address,
+            functions.withdraw,
+            validator,
+            cache,
+            batch_scheduler,
         )
 
         self.multi_input_multi_output = MultiInputMultiOutputMethod(
@@ -1948,14 +3168,26 @@ class AbiGenDummy:
             contract_address,
             functions.multiInputMultiOutput,
             validator,
+            cache,
+            batch_scheduler,
         )
 
         self.ecrecover_fn = EcrecoverFnMethod(
-            provider, contract_address, functions.ecrecoverFn, validator
+            provider,
+            contract_address,
+            functions.ecrecoverFn,
+            validator,
+            cache,
+            batch_scheduler,
         )
 
         self.accepts_bytes = AcceptsBytesMethod(
-            provider, contract_address, functions.acceptsBytes, validator
+            provider,
+            contract_address,
+            functions.acceptsBytes,
+            validator,
+            cache,
+            batch_scheduler,
         )
 
         self.no_input_simple_output = NoInputSimpleOutputMethod(
@@ -1963,14 +3195,26 @@ class AbiGenDummy:
             contract_address,
             functions.noInputSimpleOutput,
             validator,
+            cache,
+            batch_scheduler,
         )
 
         self.revert_with_constant = RevertWithConstantMethod(
-            provider, contract_address, functions.revertWithConstant, validator
+            provider,
+            contract_address,
+            functions.revertWithConstant,
+            validator,
+            cache,
+            batch_scheduler,
         )
 
         self.simple_revert = SimpleRevertMethod(
-            provider, contract_address, functions.simpleRevert, validator
+            provider,
+            contract_address,
+            functions.simpleRevert,
+            validator,
+            cache,
+            batch_scheduler,
         )
 
         self.method_using_nested_struct_with_inner_struct_not_used_elsewhere = MethodUsingNestedStructWithInnerStructNotUsedElsewhereMethod(
@@ -1978,10 +3222,17 @@ class AbiGenDummy:
             contract_address,
             functions.methodUsingNestedStructWithInnerStructNotUsedElsewhere,
             validator,
+            cache,
+            batch_scheduler,
         )
 
         self.nested_struct_output = NestedStructOutputMethod(
-            provider, contract_address, functions.nestedStructOutput, validator
+            provider,
+            contract_address,
+            functions.nestedStructOutput,
+            validator,
+            cache,
+            batch_scheduler,
         )
 
         self.require_with_constant = RequireWithConstantMethod(
@@ -1989,18 +3240,35 @@ class AbiGenDummy:
             contract_address,
             functions.requireWithConstant,
             validator,
+            cache,
+            batch_scheduler,
         )
 
         self.with_address_input = WithAddressInputMethod(
-            provider, contract_address, functions.withAddressInput, validator
+            provider,
+            contract_address,
+            functions.withAddressInput,
+            validator,
+            cache,
+            batch_scheduler,
         )
 
         self.struct_input = StructInputMethod(
-            provider, contract_address, functions.structInput, validator
+            provider,
+            contract_address,
+            functions.structInput,
+            validator,
+            cache,
+            batch_scheduler,
         )
 
         self.non_pure_method = NonPureMethodMethod(
-            provider, contract_address, functions.nonPureMethod, validator
+            provider,
+            contract_address,
+            functions.nonPureMethod,
+            validator,
+            cache,
+            batch_scheduler,
         )
 
         self.complex_input_complex_output = ComplexInputComplexOutputMethod(
@@ -2008,10 +3276,17 @@ class AbiGenDummy:
             contract_address,
             functions.complexInputComplexOutput,
             validator,
+            cache,
+            batch_scheduler,
         )
 
         self.no_input_no_output = NoInputNoOutputMethod(
-            provider, contract_address, functions.noInputNoOutput, validator
+            provider,
+            contract_address,
+            functions.noInputNoOutput,
+            validator,
+            cache,
+            batch_scheduler,
         )
 
         self.simple_pure_function_with_input = SimplePureFunctionWithInputMethod(
@@ -2019,6 +3294,8 @@ class AbiGenDummy:
             contract_address,
             functions.simplePureFunctionWithInput,
             validator,
+            cache,
+            batch_scheduler,
         )
 
         self.non_pure_method_that_returns_nothing = NonPureMethodThatReturnsNothingMethod(
@@ -2026,14 +3303,26 @@ class AbiGenDummy:
             contract_address,
             functions.nonPureMethodThatReturnsNothing,
             validator,
+            cache,
+            batch_scheduler,
         )
 
         self.simple_pure_function = SimplePureFunctionMethod(
-            provider, contract_address, functions.simplePureFunction, validator
+            provider,
+            contract_address,
+            functions.simplePureFunction,
+            validator,
+            cache,
+            batch_scheduler,
         )
 
         self.nested_struct_input = NestedStructInputMethod(
-            provider, contract_address, functions.nestedStructInput, validator
+            provider,
+            contract_address,
+            functions.nestedStructInput,
+            validator,
+            cache,
+            batch_scheduler,
         )
 
         self.method_returning_multiple_values = MethodReturningMultipleValuesMethod(
@@ -2041,6 +3330,8 @@ class AbiGenDummy:
             contract_address,
             functions.methodReturningMultipleValues,
             validator,
+            cache,
+            batch_scheduler,
         )
 
         self.method_returning_array_of_structs = MethodReturningArrayOfStructsMethod(
@@ -2048,10 +3339,17 @@ class AbiGenDummy:
             contract_address,
             functions.methodReturningArrayOfStructs,
             validator,
+            cache,
+            batch_scheduler,
         )
 
         self.struct_output = StructOutputMethod(
-            provider, contract_address, functions.structOutput, validator
+            provider,
+            contract_address,
+            functions.structOutput,
+            validator,
+            cache,
+            batch_scheduler,
         )
 
         self.pure_function_with_constant = PureFunctionWithConstantMethod(
@@ -2059,6 +3357,8 @@ class AbiGenDummy:
             contract_address,
             functions.pureFunctionWithConstant,
             validator,
+            cache,
+            batch_scheduler,
         )
 
         self.simple_input_no_output = SimpleInputNoOutputMethod(
@@ -2066,14 +3366,26 @@ class AbiGenDummy:
             contract_address,
             functions.simpleInputNoOutput,
             validator,
+            cache,
+            batch_scheduler,
         )
 
         self.overloaded_method2 = OverloadedMethod2Method(
-            provider, contract_address, functions.overloadedMethod, validator
+            provider,
+            contract_address,
+            functions.overloadedMethod,
+            validator,
+            cache,
+            batch_scheduler,
         )
 
         self.overloaded_method1 = OverloadedMethod1Method(
-            provider, contract_address, functions.overloadedMethod, validator
+            provider,
+            contract_address,
+            functions.overloadedMethod,
+            validator,
+            cache,
+            batch_scheduler,
         )
 
     def get_withdrawal_event(
@@ -2084,13 +3396,17 @@ class AbiGenDummy:
         :param tx_hash: hash of transaction emitting Withdrawal event
         """
         tx_receipt = self._web3_eth.getTransactionReceipt(tx_hash)
-        return (
-            self._web3_eth.contract(
-                address=to_checksum_address(self.contract_address),
-                abi=AbiGenDummy.abi(),
-            )
-            .events.Withdrawal()
-            .processReceipt(tx_receipt)
+        # only hand web3 the logs bearing this event's topic, rather than
+        # having it attempt to decode every log in the receipt
+        return self._contract.events.Withdrawal().processReceipt(
+            {
+                "logs": [
+                    log
+                    for log in tx_receipt["logs"]
+                    if log["topics"]
+                    and log["topics"][0] == _EVENT_TOPICS["Withdrawal"]
+                ]
+            }
         )
 
     def get_an_event_event(
@@ -2101,21 +3417,23 @@ class AbiGenDummy:
         :param tx_hash: hash of transaction emitting AnEvent event
         """
         tx_receipt = self._web3_eth.getTransactionReceipt(tx_hash)
-        return (
-            self._web3_eth.contract(
-                address=to_checksum_address(self.contract_address),
-                abi=AbiGenDummy.abi(),
-            )
-            .events.AnEvent()
-            .processReceipt(tx_receipt)
-        )
-
-    @staticmethod
-    def abi():
+        # only hand web3 the logs bearing this event's topic, rather than
+        # having it attempt to decode every log in the receipt
+        return self._contract.events.AnEvent().processReceipt(
+            {
+                "logs": [
+                    log
+                    for log in tx_receipt["logs"]
+                    if log["topics"]
+                    and log["topics"][0] == _EVENT_TOPICS["AnEvent"]
+                ]
+            }
+        )
+
+    @classmethod
+    def abi(cls):
         """Return the ABI to the underlying contract."""
-        return json.loads(
-            '[{"constant":true,"inputs":[],"name":"simpleRequire","outputs":[],"payable":false,"stateMutability":"pure","type":"function"},{"constant":true,"inputs":[{"internalType":"bytes[]","name":"a","type":"bytes[]"}],"name":"acceptsAnArrayOfBytes","outputs":[],"payable":false,"stateMutability":"pure","type":"function"},{"constant":true,"inputs":[{"internalType":"uint256","name":"index_0","type":"uint256"}],"name":"simpleInputSimpleOutput","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"payable":false,"stateMutability":"pure","type":"function"},{"constant":false,"inputs":[{"internalType":"uint256","name":"wad","type":"uint256"}],"name":"withdraw","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[{"internalType":"uint256","name":"index_0","type":"uint256"},{"internalType":"bytes","name":"index_1","type":"bytes"},{"internalType":"string","name":"index_2","type":"string"}],"name":"multiInputMultiOutput","outputs":[{"internalType":"bytes","name":"","type":"bytes"},{"internalType":"bytes","name":"","type":"bytes"},{"internalType":"string","name":"","type":"string"}],"payable":false,"stateMutability":"pure","type":"function"},{"constant":true,"inputs":[{"internalType":"bytes32","name":"hash","type":"bytes32"},{"internalType":"uint8","name":"v","type":"uint8"},{"internalType":"bytes32","name":"r","type":"bytes32"},{"internalType":"bytes32","name":"s","type":"bytes32"}],"name":"ecrecoverFn","outputs":[{"internalType":"address","name":"signerAddress","type":"address"}],"payable":false,"stateMutability":"pure","type":"function"},{"constant":true,"inputs":[{"internalType":"bytes","name":"a","type":"bytes"}],"name":"acceptsBytes","outputs":[],"payable":false,"stateMutability":"pure","type":"function"},{"constant":true,"inputs":[],"name":"noInputSimpleOutput","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"payable":false,"stateMutability":"pure","type":"function"},{"constant":true,"inputs":[],"name":"revertWithConstant","outputs":[],"payable":false,"stateMutability":"pure","type":"function"},{"constant":true,"inputs":[],"name":"simpleRevert","outputs":[],"payable":false,"stateMutability":"pure","type":"function"},{"constant":true,"inputs":[],"name":"methodUsingNestedStructWithInnerStructNotUsedElsewhere","outputs":[{"components":[{"components":[{"internalType":"uint256","name":"aField","type":"uint256"}],"internalType":"struct AbiGenDummy.StructNotDirectlyUsedAnywhere","name":"innerStruct","type":"tuple"}],"internalType":"struct AbiGenDummy.NestedStructWithInnerStructNotUsedElsewhere","name":"","type":"tuple"}],"payable":false,"stateMutability":"pure","type":"function"},{"constant":true,"inputs":[],"name":"nestedStructOutput","outputs":[{"components":[{"components":[{"internalType":"bytes","name":"someBytes","type":"bytes"},{"internalType":"uint32","name":"anInteger","type":"uint32"},{"internalType":"bytes[]","name":"aDynamicArrayOfBytes","type":"bytes[]"},{"internalType":"string","name":"aString","type":"string"}],"internalType":"struct AbiGenDummy.Struct","name":"innerStruct","type":"tuple"},{"internalType":"string","name":"description","type":"string"}],"internalType":"struct AbiGenDummy.NestedStruct","name":"","type":"tuple"}],"payable":false,"stateMutability":"pure","type":"function"},{"constant":true,"inputs":[],"name":"requireWithConstant","outputs":[],"payable":false,"stateMutability":"pure","type":"function"},{"constant":true,"inputs":[{"internalType":"address","name":"x","type":"address"},{"internalType":"uint256","name":"a","type":"uint256"},{"internalType":"uint256","name":"b","type":"uint256"},{"internalType":"address","name":"y","type":"address"},{"internalType":"uint256","name":"c","type":"uint256"}],"name":"withAddressInput","outputs":[{"internalType":"address","name":"z","type":"address"}],"payable":false,"stateMutability":"pure","type":"function"},{"constant":true,"inputs":[{"components":[{"internalType":"bytes","name":"someBytes","type":"bytes"},{"internalType":"uint32","name":"anInteger","type":"uint32"},{"internalType":"bytes[]","name":"aDynamicArrayOfBytes","type":"bytes[]"},{"internalType":"string","name":"aString","type":"string"}],"internalType":"struct AbiGenDummy.Struct","name":"s","type":"tuple"}],"name":"structInput","outputs":[],"payable":false,"stateMutability":"pure","type":"function"},{"constant":false,"inputs":[],"name":"nonPureMethod","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[{"components":[{"internalType":"uint256","name":"foo","type":"uint256"},{"internalType":"bytes","name":"bar","type":"bytes"},{"internalType":"string","name":"car","type":"string"}],"internalType":"struct AbiGenDummy.ComplexInput","name":"complexInput","type":"tuple"}],"name":"complexInputComplexOutput","outputs":[{"components":[{"components":[{"internalType":"uint256","name":"foo","type":"uint256"},{"internalType":"bytes","name":"bar","type":"bytes"},{"internalType":"string","name":"car","type":"string"}],"internalType":"struct AbiGenDummy.ComplexInput","name":"input","type":"tuple"},{"internalType":"bytes","name":"lorem","type":"bytes"},{"internalType":"bytes","name":"ipsum","type":"bytes"},{"internalType":"string","name":"dolor","type":"string"}],"internalType":"struct AbiGenDummy.ComplexOutput","name":"","type":"tuple"}],"payable":false,"stateMutability":"pure","type":"function"},{"constant":true,"inputs":[],"name":"noInputNoOutput","outputs":[],"payable":false,"stateMutability":"pure","type":"function"},{"constant":true,"inputs":[{"internalType":"uint256","name":"x","type":"uint256"}],"name":"simplePureFunctionWithInput","outputs":[{"internalType":"uint256","name":"sum","type":"uint256"}],"payable":false,"stateMutability":"pure","type":"function"},{"constant":false,"inputs":[],"name":"nonPureMethodThatReturnsNothing","outputs":[],"payable":false,"stateMutability":"nonpayable","type":"function"},{"constant":true,"inputs":[],"name":"simplePureFunction","outputs":[{"internalType":"uint256","name":"result","type":"uint256"}],"payable":false,"stateMutability":"pure","type":"function"},{"constant":true,"inputs":[{"components":[{"components":[{"internalType":"bytes","name":"someBytes","type":"bytes"},{"internalType":"uint32","name":"anInteger","type":"uint32"},{"internalType":"bytes[]","name":"aDynamicArrayOfBytes","type":"bytes[]"},{"internalType":"string","name":"aString","type":"string"}],"internalType":"struct AbiGenDummy.Struct","name":"innerStruct","type":"tuple"},{"internalType":"string","name":"description","type":"string"}],"internalType":"struct AbiGenDummy.NestedStruct","name":"n","type":"tuple"}],"name":"nestedStructInput","outputs":[],"payable":false,"stateMutability":"pure","type":"function"},{"constant":true,"inputs":[],"name":"methodReturningMultipleValues","outputs":[{"internalType":"uint256","name":"","type":"uint256"},{"internalType":"string","name":"","type":"string"}],"payable":false,"stateMutability":"pure","type":"function"},{"constant":true,"inputs":[],"name":"methodReturningArrayOfStructs","outputs":[{"components":[{"internalType":"bytes","name":"someBytes","type":"bytes"},{"internalType":"uint32","name":"anInteger","type":"uint32"},{"internalType":"bytes[]","name":"aDynamicArrayOfBytes","type":"bytes[]"},{"internalType":"string","name":"aString","type":"string"}],"internalType":"struct AbiGenDummy.Struct[]","name":"","type":"tuple[]"}],"payable":false,"stateMutability":"pure","type":"function"},{"constant":true,"inputs":[],"name":"structOutput","outputs":[{"components":[{"internalType":"bytes","name":"someBytes","type":"bytes"},{"internalType":"uint32","name":"anInteger","type":"uint32"},{"internalType":"bytes[]","name":"aDynamicArrayOfBytes","type":"bytes[]"},{"internalType":"string","name":"aString","type":"string"}],"internalType":"struct AbiGenDummy.Struct","name":"s","type":"tuple"}],"payable":false,"stateMutability":"pure","type":"function"},{"constant":true,"inputs":[],"name":"pureFunctionWithConstant","outputs":[{"internalType":"uint256","name":"someConstant","type":"uint256"}],"payable":false,"stateMutability":"pure","type":"function"},{"constant":true,"inputs":[{"internalType":"uint256","name":"index_0","type":"uint256"}],"name":"simpleInputNoOutput","outputs":[],"payable":false,"stateMutability":"pure","type":"function"},{"constant":true,"inputs":[{"internalType":"string","name":"a","type":"string"}],"name":"overloadedMethod","outputs":[],"payable":false,"stateMutability":"pure","type":"function"},{"constant":true,"inputs":[{"internalType":"int256","name":"a","type":"int256"}],"name":"overloadedMethod","outputs":[],"payable":false,"stateMutability":"pure","type":"function"},{"anonymous":false,"inputs":[{"indexed":true,"internalType":"address","name":"_owner","type":"address"},{"indexed":false,"internalType":"uint256","name":"_value","type":"uint256"}],"name":"Withdrawal","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"internalType":"uint8","name":"param","type":"uint8"}],"name":"AnEvent","type":"event"}]'  # noqa: E501 (line-too-long)
-        )
+        return cls.ABI
 
 
 # pylint: disable=too-many-lines
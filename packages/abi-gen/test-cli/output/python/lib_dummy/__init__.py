@@ -2,16 +2,18 @@
 
 # pylint: disable=too-many-arguments
 
-import json
+from concurrent.futures import Future  # pylint: disable=unused-import
 from typing import (  # pylint: disable=unused-import
     Any,
+    Dict,
     List,
+    MutableMapping,
     Optional,
     Tuple,
     Union,
 )
 
-from eth_utils import to_checksum_address
+from eth_utils import event_abi_to_log_topic, to_checksum_address
 from mypy_extensions import TypedDict  # pylint: disable=unused-import
 from hexbytes import HexBytes
 from web3 import Web3
@@ -19,7 +21,11 @@ from web3.contract import ContractFunction
 from web3.datastructures import AttributeDict
 from web3.providers.base import BaseProvider
 
-from zero_ex.contract_wrappers.bases import ContractMethod, Validator
+from zero_ex.contract_wrappers.bases import (
+    BatchScheduler,
+    ContractMethod,
+    Validator,
+)
 from zero_ex.contract_wrappers.tx_params import TxParams
 
 
@@ -40,10 +46,22 @@ except ImportError:
         """No-op input validator."""
 
 
+_ABI: List[Dict[str, Any]] = []
+
+_EVENT_TOPICS = {
+    abi["name"]: event_abi_to_log_topic(abi)
+    for abi in _ABI
+    if abi["type"] == "event" and not abi.get("anonymous")
+}
+
+
 # pylint: disable=too-many-public-methods,too-many-instance-attributes
 class LibDummy:
     """Wrapper class for LibDummy Solidity contract."""
 
+    ABI: List[Dict[str, Any]] = _ABI
+    """ABI of the underlying contract."""
+
     def __init__(
         self,
         provider: BaseProvider,
@@ -65,10 +83,14 @@ class LibDummy:
             provider
         ).eth
 
-    @staticmethod
-    def abi():
+        self._contract = self._web3_eth.contract(
+            address=to_checksum_address(contract_address), abi=LibDummy.ABI
+        )
+
+    @classmethod
+    def abi(cls):
         """Return the ABI to the underlying contract."""
-        return json.loads("[]")  # noqa: E501 (line-too-long)
+        return cls.ABI
 
 
 # pylint: disable=too-many-lines
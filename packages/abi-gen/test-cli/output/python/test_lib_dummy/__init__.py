@@ -2,16 +2,18 @@
 
 # pylint: disable=too-many-arguments
 
-import json
+from concurrent.futures import Future  # pylint: disable=unused-import
 from typing import (  # pylint: disable=unused-import
     Any,
+    Dict,
     List,
+    MutableMapping,
     Optional,
     Tuple,
     Union,
 )
 
-from eth_utils import to_checksum_address
+from eth_utils import event_abi_to_log_topic, to_checksum_address
 from mypy_extensions import TypedDict  # pylint: disable=unused-import
 from hexbytes import HexBytes
 from web3 import Web3
@@ -19,7 +21,11 @@ from web3.contract import ContractFunction
 from web3.datastructures import AttributeDict
 from web3.providers.base import BaseProvider
 
-from zero_ex.contract_wrappers.bases import ContractMethod, Validator
+from zero_ex.contract_wrappers.bases import (
+    BatchScheduler,
+    ContractMethod,
+    Validator,
+)
 from zero_ex.contract_wrappers.tx_params import TxParams
 
 
@@ -49,9 +55,13 @@ class PublicAddConstantMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
     def validate_and_normalize_inputs(self, x: int):
@@ -61,19 +71,64 @@ class PublicAddConstantMethod(ContractMethod):
             parameter_name="x",
             argument_value=x,
         )
-        # safeguard against fractional inputs
-        x = int(x)
+        # safeguard against fractional inputs, skipping the common case of an
+        # exact int (but not a bool)
+        if type(x) is not int:  # pylint: disable=unidiomatic-typecheck
+            x = int(x)
         return x
 
-    def call(self, x: int, tx_params: Optional[TxParams] = None) -> int:
+    def call(
+        self,
+        x: int,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
+    ) -> int:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
+
+        """
+        (x) = self.validate_and_normalize_inputs(x)
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_by_selector(
+            ("0x22935e92", ["uint256"], ["uint256"]),
+            [x],
+            tx_params,
+            block_identifier,
+        )
+
+    def call_batch(
+        self, inputs: List[Tuple[int]], tx_params: Optional[TxParams] = None
+    ) -> List[int]:
+        """Execute underlying contract method via one batched eth_call.
+
+        Each element of `inputs`:code: holds the arguments to one call.  All
+        of the calls are aggregated through the Multicall3 contract, which
+        must be deployed on the network.
+
+        :param inputs: tuples of arguments, one tuple for each call
+        :param tx_params: transaction parameters
+        :returns: the return value of each call, in order.
+        """
+        tx_params = self.normalize_tx_params(tx_params)
+        contract_functions = []
+        for args in inputs:
+            (x) = self.validate_and_normalize_inputs(*args)
+            contract_functions.append(self.underlying_method(x))
+        return self.aggregate_calls(contract_functions, tx_params)
+
+    def call_async(self, x: int) -> Future:
+        """Execute underlying contract method via a shared, batched eth_call.
 
+        Calls made from several threads at about the same time are
+        aggregated through the Multicall3 contract, which must be deployed on
+        the network.
+
+        :returns: a :class:`concurrent.futures.Future` for the return value.
         """
         (x) = self.validate_and_normalize_inputs(x)
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method(x).call(tx_params.as_dict())
+        return self.submit_call(self.underlying_method(x))
 
     def send_transaction(
         self, x: int, tx_params: Optional[TxParams] = None
@@ -84,7 +139,7 @@ class PublicAddConstantMethod(ContractMethod):
 
         """
         (x) = self.validate_and_normalize_inputs(x)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(x).transact(tx_params.as_dict())
 
     def estimate_gas(
@@ -92,7 +147,7 @@ class PublicAddConstantMethod(ContractMethod):
     ) -> int:
         """Estimate gas consumption of method call."""
         (x) = self.validate_and_normalize_inputs(x)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(x).estimateGas(tx_params.as_dict())
 
 
@@ -105,9 +160,13 @@ class PublicAddOneMethod(ContractMethod):
         contract_address: str,
         contract_function: ContractFunction,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Persist instance data."""
-        super().__init__(provider, contract_address, validator)
+        super().__init__(
+            provider, contract_address, validator, cache, batch_scheduler
+        )
         self.underlying_method = contract_function
 
     def validate_and_normalize_inputs(self, x: int):
@@ -115,19 +174,64 @@ class PublicAddOneMethod(ContractMethod):
         self.validator.assert_valid(
             method_name="publicAddOne", parameter_name="x", argument_value=x
         )
-        # safeguard against fractional inputs
-        x = int(x)
+        # safeguard against fractional inputs, skipping the common case of an
+        # exact int (but not a bool)
+        if type(x) is not int:  # pylint: disable=unidiomatic-typecheck
+            x = int(x)
         return x
 
-    def call(self, x: int, tx_params: Optional[TxParams] = None) -> int:
+    def call(
+        self,
+        x: int,
+        tx_params: Optional[TxParams] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
+    ) -> int:
         """Execute underlying contract method via eth_call.
 
         :param tx_params: transaction parameters
+        :param block_identifier: block at which to execute the call
 
         """
         (x) = self.validate_and_normalize_inputs(x)
-        tx_params = super().normalize_tx_params(tx_params)
-        return self.underlying_method(x).call(tx_params.as_dict())
+        tx_params = self.normalize_tx_params(tx_params)
+        return self.call_by_selector(
+            ("0x2b82fdf0", ["uint256"], ["uint256"]),
+            [x],
+            tx_params,
+            block_identifier,
+        )
+
+    def call_batch(
+        self, inputs: List[Tuple[int]], tx_params: Optional[TxParams] = None
+    ) -> List[int]:
+        """Execute underlying contract method via one batched eth_call.
+
+        Each element of `inputs`:code: holds the arguments to one call.  All
+        of the calls are aggregated through the Multicall3 contract, which
+        must be deployed on the network.
+
+        :param inputs: tuples of arguments, one tuple for each call
+        :param tx_params: transaction parameters
+        :returns: the return value of each call, in order.
+        """
+        tx_params = self.normalize_tx_params(tx_params)
+        contract_functions = []
+        for args in inputs:
+            (x) = self.validate_and_normalize_inputs(*args)
+            contract_functions.append(self.underlying_method(x))
+        return self.aggregate_calls(contract_functions, tx_params)
+
+    def call_async(self, x: int) -> Future:
+        """Execute underlying contract method via a shared, batched eth_call.
+
+        Calls made from several threads at about the same time are
+        aggregated through the Multicall3 contract, which must be deployed on
+        the network.
+
+        :returns: a :class:`concurrent.futures.Future` for the return value.
+        """
+        (x) = self.validate_and_normalize_inputs(x)
+        return self.submit_call(self.underlying_method(x))
 
     def send_transaction(
         self, x: int, tx_params: Optional[TxParams] = None
@@ -138,7 +242,7 @@ class PublicAddOneMethod(ContractMethod):
 
         """
         (x) = self.validate_and_normalize_inputs(x)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(x).transact(tx_params.as_dict())
 
     def estimate_gas(
@@ -146,14 +250,45 @@ class PublicAddOneMethod(ContractMethod):
     ) -> int:
         """Estimate gas consumption of method call."""
         (x) = self.validate_and_normalize_inputs(x)
-        tx_params = super().normalize_tx_params(tx_params)
+        tx_params = self.normalize_tx_params(tx_params)
         return self.underlying_method(x).estimateGas(tx_params.as_dict())
 
 
+_ABI: List[Dict[str, Any]] = [
+    {
+        "constant": True,
+        "inputs": [{"name": "x", "type": "uint256"}],
+        "name": "publicAddConstant",
+        "outputs": [{"name": "result", "type": "uint256"}],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [{"name": "x", "type": "uint256"}],
+        "name": "publicAddOne",
+        "outputs": [{"name": "result", "type": "uint256"}],
+        "payable": False,
+        "stateMutability": "pure",
+        "type": "function",
+    },
+]
+
+_EVENT_TOPICS = {
+    abi["name"]: event_abi_to_log_topic(abi)
+    for abi in _ABI
+    if abi["type"] == "event" and not abi.get("anonymous")
+}
+
+
 # pylint: disable=too-many-public-methods,too-many-instance-attributes
 class TestLibDummy:
     """Wrapper class for TestLibDummy Solidity contract."""
 
+    ABI: List[Dict[str, Any]] = _ABI
+    """ABI of the underlying contract."""
+
     public_add_constant: PublicAddConstantMethod
     """Constructor-initialized instance of
     :class:`PublicAddConstantMethod`.
@@ -169,12 +304,16 @@ class TestLibDummy:
         provider: BaseProvider,
         contract_address: str,
         validator: TestLibDummyValidator = None,
+        cache: Optional[MutableMapping] = None,
     ):
         """Get an instance of wrapper for smart contract.
 
         :param provider: instance of :class:`web3.providers.base.BaseProvider`
         :param contract_address: where the contract has been deployed
         :param validator: for validation of method inputs.
+        :param cache: optional mapping in which to keep the results of
+            read-only calls made at a specific block number or hash, so that
+            repeating such a call doesn't query the node again.
         """
         self.contract_address = contract_address
 
@@ -185,25 +324,37 @@ class TestLibDummy:
             provider
         ).eth
 
-        functions = self._web3_eth.contract(
-            address=to_checksum_address(contract_address),
-            abi=TestLibDummy.abi(),
-        ).functions
+        self._contract = self._web3_eth.contract(
+            address=to_checksum_address(contract_address), abi=TestLibDummy.ABI
+        )
+
+        functions = self._contract.functions
+        # shared, so that concurrent call_async()s of different methods can be
+        # aggregated together
+        batch_scheduler = BatchScheduler()
 
         self.public_add_constant = PublicAddConstantMethod(
-            provider, contract_address, functions.publicAddConstant, validator
+            provider,
+            contract_address,
+            functions.publicAddConstant,
+            validator,
+            cache,
+            batch_scheduler,
         )
 
         self.public_add_one = PublicAddOneMethod(
-            provider, contract_address, functions.publicAddOne, validator
+            provider,
+            contract_address,
+            functions.publicAddOne,
+            validator,
+            cache,
+            batch_scheduler,
         )
 
-    @staticmethod
-    def abi():
+    @classmethod
+    def abi(cls):
         """Return the ABI to the underlying contract."""
-        return json.loads(
-            '[{"constant":true,"inputs":[{"name":"x","type":"uint256"}],"name":"publicAddConstant","outputs":[{"name":"result","type":"uint256"}],"payable":false,"stateMutability":"pure","type":"function"},{"constant":true,"inputs":[{"name":"x","type":"uint256"}],"name":"publicAddOne","outputs":[{"name":"result","type":"uint256"}],"payable":false,"stateMutability":"pure","type":"function"}]'  # noqa: E501 (line-too-long)
-        )
+        return cls.ABI
 
 
 # pylint: disable=too-many-lines
@@ -96,3 +96,44 @@ describe('isOutputFileUpToDate()', () => {
         });
     });
 });
+
+describe('toPythonLiteral()', () => {
+    it('should translate null and booleans', () => {
+        expect(utils.toPythonLiteral(null)).to.equal('None');
+        expect(utils.toPythonLiteral(true)).to.equal('True');
+        expect(utils.toPythonLiteral(false)).to.equal('False');
+    });
+    it('should keep numbers and plain strings as they are in JSON', () => {
+        expect(utils.toPythonLiteral(42)).to.equal('42');
+        expect(utils.toPythonLiteral('uint256')).to.equal('"uint256"');
+    });
+    it('should escape quotes and backslashes in strings', () => {
+        expect(utils.toPythonLiteral('say "hi"\\n')).to.equal('"say \\"hi\\"\\\\n"');
+        expect(utils.toPythonLiteral("it's")).to.equal('"it\'s"');
+    });
+    it('should escape control characters in strings', () => {
+        expect(utils.toPythonLiteral('line\nbreak\ttab')).to.equal('"line\\nbreak\\ttab"');
+    });
+    it('should keep non-ASCII text in strings', () => {
+        expect(utils.toPythonLiteral('Ünïcødé ✓')).to.equal('"Ünïcødé ✓"');
+    });
+    it('should translate nested arrays and objects', () => {
+        const abi = [
+            {
+                constant: true,
+                inputs: [{ components: [{ name: 'x', type: 'uint8[]' }], name: 'pair', type: 'tuple' }],
+                name: 'f',
+                outputs: [],
+                payable: false,
+            },
+            [[], {}, [null]],
+        ];
+        expect(utils.toPythonLiteral(abi)).to.equal(
+            '[{"constant": True, "inputs": [{"components": [{"name": "x", "type": "uint8[]"}], "name": "pair", ' +
+                '"type": "tuple"}], "name": "f", "outputs": [], "payable": False}, [[], {}, [None]]]',
+        );
+    });
+    it('should escape quotes in object keys', () => {
+        expect(utils.toPythonLiteral({ 'a"b': 1 })).to.equal('{"a\\"b": 1}');
+    });
+});
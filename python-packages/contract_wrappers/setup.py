@@ -219,8 +219,10 @@ setup(
         "0x-order-utils",
         "web3",
         "attrs",
+        "eth-abi",
         "eth_utils",
         "mypy_extensions",
+        "requests",
     ],
     extras_require={
         "dev": [
@@ -1,14 +1,355 @@
 """Base wrapper class for accessing ethereum smart contracts."""
 
-from typing import Any
+import json
+import threading
+import time
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-from eth_utils import is_address, to_checksum_address
-from web3 import Web3
+import requests
+from eth_abi import decode_abi, encode_abi
+from eth_utils import (
+    is_0x_prefixed,
+    is_address,
+    is_hex,
+    to_bytes,
+    to_checksum_address,
+)
+from hexbytes import HexBytes
+from web3 import HTTPProvider, Web3
+from web3.contract import Contract, ContractFunction, parse_block_identifier
+from web3.exceptions import BadFunctionCallOutput
 from web3.providers.base import BaseProvider
 
 from .tx_params import TxParams
 
 
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+"""Address of the Multicall3 contract, used to batch read-only calls.
+
+Multicall3 is deployed at this same address on mainnet and on most test
+networks.
+"""
+
+_MULTICALL3_AGGREGATE_ABI = [
+    {
+        "constant": False,
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate",
+        "outputs": [
+            {"name": "blockNumber", "type": "uint256"},
+            {"name": "returnData", "type": "bytes[]"},
+        ],
+        "payable": True,
+        "stateMutability": "payable",
+        "type": "function",
+    }
+]
+
+_GAS_BUFFER = 100000
+"""Gas added to estimates for batched transactions, as web3 does."""
+
+_BATCH_REQUEST_TIMEOUT = 10
+"""Seconds to wait for a batch of JSON-RPC requests, as web3 does for one."""
+
+_MAX_BATCH_CEILING = 256
+"""Most calls that a :class:`BatchScheduler` will aggregate at once."""
+
+
+def _abi_type_string(parameter: Dict[str, Any]) -> str:
+    """Get the canonical type string for an ABI parameter definition."""
+    if parameter["type"].startswith("tuple"):
+        array_suffix = parameter["type"].partition("tuple")[2]
+        return "({}){}".format(
+            ",".join(
+                _abi_type_string(component)
+                for component in parameter["components"]
+            ),
+            array_suffix,
+        )
+    return parameter["type"]
+
+
+def _normalize_argument(abi_type: str, value: Any) -> Any:
+    """Convert an argument for encoding, as web3 does for contract calls.
+
+    In particular, a hex string is accepted for a `bytes`:code: or
+    `bytesN`:code: parameter.
+    """
+    if abi_type.endswith("]"):
+        element_type = abi_type[: abi_type.rindex("[")]
+        return [_normalize_argument(element_type, item) for item in value]
+    if abi_type.startswith("bytes") and isinstance(value, str):
+        return to_bytes(hexstr=value)
+    if abi_type == "string" and isinstance(value, bytes):
+        return value.decode("utf-8")
+    return value
+
+
+def _checksum_addresses(parameter: Dict[str, Any], value: Any) -> Any:
+    """Checksum any addresses in a decoded value, as web3 does for calls."""
+    if parameter["type"].endswith("]"):
+        element = dict(
+            parameter, type=parameter["type"][: parameter["type"].rindex("[")]
+        )
+        return [_checksum_addresses(element, item) for item in value]
+    if parameter["type"] == "tuple":
+        return tuple(
+            _checksum_addresses(component, item)
+            for component, item in zip(parameter["components"], value)
+        )
+    if parameter["type"] == "address":
+        return to_checksum_address(value)
+    return value
+
+
+def _decode_return_data(outputs: Sequence[Dict[str, Any]], data: bytes) -> Any:
+    """Decode the data returned by an eth_call, as web3 does for calls."""
+    decoded = [
+        _checksum_addresses(output, value)
+        for output, value in zip(
+            outputs,
+            decode_abi([_abi_type_string(output) for output in outputs], data),
+        )
+    ]
+    return decoded[0] if len(decoded) == 1 else decoded
+
+
+def _is_specific_block(block_identifier: Union[int, str, bytes]) -> bool:
+    """Tell whether a block identifier names one block, by number or hash.
+
+    Tags such as "latest" or "finalized" name different blocks over time.
+    """
+    if isinstance(block_identifier, bytes):
+        return len(block_identifier) == 32
+    if isinstance(block_identifier, str):
+        return is_0x_prefixed(block_identifier) and is_hex(block_identifier)
+    return isinstance(block_identifier, int) and not isinstance(
+        block_identifier, bool
+    )
+
+
+def _to_rpc_transaction(transaction: Dict[str, Any]) -> Dict[str, Any]:
+    """Hex-encode the integer fields of a transaction, for a raw request."""
+    return {
+        key: hex(value) if isinstance(value, int) else value
+        for key, value in transaction.items()
+    }
+
+
+def _make_batch_request(
+    web3: Web3, rpc_requests: Sequence[Tuple[str, List[Any]]]
+) -> List[Dict[str, Any]]:
+    """Make several JSON-RPC requests, as a single batch where possible.
+
+    Requests to an :class:`web3.HTTPProvider` are sent together in a single
+    HTTP POST, bypassing web3's middleware.  Other providers get the requests
+    one at a time, through the middleware of the given web3 instance.
+
+    :param web3: Web3 instance through whose provider to make the requests.
+    :param rpc_requests: (method, params) pair for each request.
+    :returns: The JSON-RPC response to each request, in order, each bearing
+        either a "result" or an "error".
+    :raises ValueError: if the node rejects the batch as a whole.
+    """
+    provider = web3.provider
+    if not isinstance(provider, HTTPProvider):
+        rpc_responses: List[Dict[str, Any]] = []
+        for method, params in rpc_requests:
+            try:
+                rpc_responses.append(
+                    {"result": web3.manager.request_blocking(method, params)}
+                )
+            except ValueError as error:
+                rpc_responses.append({"error": error.args[0]})
+        return rpc_responses
+
+    request_kwargs = provider.get_request_kwargs()
+    request_kwargs.setdefault("timeout", _BATCH_REQUEST_TIMEOUT)
+    response = requests.post(
+        provider.endpoint_uri,
+        data=json.dumps(
+            [
+                {"jsonrpc": "2.0", "method": method, "params": params, "id": i}
+                for i, (method, params) in enumerate(rpc_requests)
+            ]
+        ),
+        **request_kwargs,
+    )
+    response.raise_for_status()
+    rpc_responses = response.json()
+    if not isinstance(rpc_responses, list):
+        # eg a node which doesn't support batches answers with one error
+        raise ValueError(
+            rpc_responses.get("error", rpc_responses)
+            if isinstance(rpc_responses, dict)
+            else rpc_responses
+        )
+    rpc_responses_by_id = {
+        rpc_response.get("id"): rpc_response for rpc_response in rpc_responses
+    }
+    return [
+        rpc_responses_by_id.get(i, {"error": "No response to request"})
+        for i in range(len(rpc_requests))
+    ]
+
+
+def _to_int(quantity: Union[int, str]) -> int:
+    """Get a JSON-RPC quantity, which middleware may have made an int."""
+    return quantity if isinstance(quantity, int) else int(quantity, 16)
+
+
+def _batch_results(rpc_responses: Sequence[Dict[str, Any]]) -> List[Any]:
+    """Get the result of each JSON-RPC response, raising any error as web3."""
+    results = []
+    for rpc_response in rpc_responses:
+        if "error" in rpc_response:
+            raise ValueError(rpc_response["error"])
+        results.append(rpc_response["result"])
+    return results
+
+
+class TransactionBatchError(ValueError):
+    """Some transactions of a batch could not be sent.
+
+    The rest of the batch was sent regardless.
+    """
+
+    def __init__(self, tx_hashes: List[Optional[HexBytes]], errors: List[Any]):
+        """Initialize the instance.
+
+        :param tx_hashes: The hash of each transaction which was sent, or
+            None for each which wasn't, in order.
+        :param errors: The JSON-RPC error for each transaction which wasn't
+            sent, or None for each which was, in order.
+        """
+        super().__init__(
+            "{} of {} transactions could not be sent: {}".format(
+                len([error for error in errors if error is not None]),
+                len(errors),
+                [error for error in errors if error is not None],
+            )
+        )
+        self.tx_hashes = tx_hashes
+        self.errors = errors
+
+
+class BatchScheduler:
+    """Coalesce concurrently submitted read-only calls into aggregate calls.
+
+    Submitted calls wait in a queue, which a background thread flushes as a
+    single aggregate call once `max_batch`:code: calls are queued, or once
+    `max_wait`:code: seconds have passed, whichever comes first.  The thread
+    exits whenever the queue is empty, and is restarted by the next submission.
+
+    Both limits adapt to the observed concurrency: `max_batch`:code: doubles
+    while calls queue up faster than full batches are flushed, and halves
+    back toward its initial value while the timer flushes batches less than
+    half full; `max_wait`:code: halves, down to a quarter of its initial
+    value, while the timer fires on lone calls, for which waiting only adds
+    latency, and doubles back up once it catches several.
+    """
+
+    def __init__(self, max_batch: int = 32, max_wait: float = 0.002):
+        """Initialize the instance.
+
+        :param max_batch: Initial, and least, number of calls at which to
+            flush the queue.
+        :param max_wait: Initial, and most, seconds to hold a call in the
+            queue.
+        """
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._initial_max_batch = max_batch
+        self._initial_max_wait = max_wait
+        self._queue: List[Tuple[ContractFunction, Callable, Future]] = []
+        self._condition = threading.Condition()
+        self._flushing = False
+
+    def submit(
+        self,
+        contract_function: ContractFunction,
+        aggregate: Callable[[List[ContractFunction]], List[Any]],
+    ) -> Future:
+        """Queue a call, returning a future for its result.
+
+        :param contract_function: Contract function, with its arguments
+            already bound, to be called.
+        :param aggregate: Executes a list of calls, returning their results.
+            A batch is executed by the aggregate given with its first call.
+        """
+        future: Future = Future()
+        with self._condition:
+            self._queue.append((contract_function, aggregate, future))
+            if not self._flushing:
+                self._flushing = True
+                threading.Thread(target=self._flush, daemon=True).start()
+            self._condition.notify()
+        return future
+
+    def _flush(self):
+        while True:
+            with self._condition:
+                if not self._queue:
+                    self._flushing = False
+                    return
+                deadline = time.monotonic() + self.max_wait
+                while len(self._queue) < self.max_batch:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch = self._queue[: self.max_batch]
+                del self._queue[: self.max_batch]
+                self._tune(len(batch), len(self._queue))
+            self._dispatch(batch)
+
+    def _tune(self, batch_size: int, backlog: int):
+        if batch_size == self.max_batch and backlog:
+            self.max_batch = min(self.max_batch * 2, _MAX_BATCH_CEILING)
+        elif batch_size * 2 <= self.max_batch:
+            self.max_batch = max(self.max_batch // 2, self._initial_max_batch)
+        if batch_size == 1:
+            self.max_wait = max(self.max_wait / 2, self._initial_max_wait / 4)
+        else:
+            self.max_wait = min(self.max_wait * 2, self._initial_max_wait)
+
+    def _dispatch(
+        self, batch: List[Tuple[ContractFunction, Callable, Future]]
+    ):
+        (_, aggregate, _) = batch[0]
+        try:
+            results = aggregate(
+                [contract_function for contract_function, _, _ in batch]
+            )
+        except Exception as error:  # pylint: disable=broad-except
+            for _, _, future in batch:
+                future.set_exception(error)
+        else:
+            for (_, _, future), result in zip(batch, results):
+                future.set_result(result)
+
+
 class Validator:
     """Base class for validating inputs to methods."""
 
@@ -30,26 +371,45 @@ class Validator:
 class ContractMethod:
     """Base class for wrapping an Ethereum smart contract method."""
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         provider: BaseProvider,
         contract_address: str,
         validator: Validator = None,
+        cache: Optional[MutableMapping] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
     ):
         """Instantiate the object.
 
         :param provider: Instance of :class:`web3.providers.base.BaseProvider`
         :param contract_address: Where the contract has been deployed to.
         :param validator: Used to validate method inputs.
+        :param cache: Optional mapping in which to keep the results of calls
+            made at a specific block, which can never change.  Defaults to no
+            caching.
+        :param batch_scheduler: Scheduler through which to aggregate calls
+            submitted via :meth:`submit_call`, which may be shared with the
+            other methods of the same contract.  Defaults to one of this
+            method's own, created on first use.
         """
+        self._provider = provider
         self._web3_eth = Web3(provider).eth  # pylint: disable=no-member
+        self._contract_address = to_checksum_address(contract_address)
         if validator is None:
             validator = Validator(provider, contract_address)
         self.validator = validator
+        self._cache = cache
+        self._multicall: Optional[Contract] = None
+        self._batch_scheduler = batch_scheduler
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def validate_and_checksum_address(address: str):
-        """Validate the given address, and return it's checksum address."""
+        """Validate the given address, and return it's checksum address.
+
+        Results are memoized, because checksumming hashes the address, and the
+        same few addresses tend to be passed over and over again.
+        """
         if not is_address(address):
             raise TypeError("Invalid address provided: {}".format(address))
         return to_checksum_address(address)
@@ -64,3 +424,275 @@ class ContractMethod:
             )
         tx_params.from_ = self.validate_and_checksum_address(tx_params.from_)
         return tx_params
+
+    def aggregate_calls(
+        self,
+        contract_functions: Sequence[ContractFunction],
+        tx_params: TxParams,
+    ) -> List[Any]:
+        """Execute several read-only calls via a single eth_call.
+
+        The calls are submitted together to the Multicall3 contract at
+        :data:`MULTICALL3_ADDRESS`, so that N calls cost one round trip to the
+        node rather than N.
+
+        :param contract_functions: Contract functions, with their arguments
+            already bound, to be called.
+        :param tx_params: Transaction parameters for the aggregate eth_call.
+        :returns: The decoded return value of each call, in order.
+        """
+        if self._multicall is None:
+            self._multicall = self._web3_eth.contract(
+                address=MULTICALL3_ADDRESS, abi=_MULTICALL3_AGGREGATE_ABI
+            )
+        (_, return_data) = self._multicall.functions.aggregate(
+            [
+                (
+                    contract_function.address,
+                    # pylint: disable=protected-access
+                    contract_function._encode_transaction_data(),
+                )
+                for contract_function in contract_functions
+            ]
+        ).call(tx_params.as_dict())
+
+        return [
+            _decode_return_data(contract_function.abi["outputs"], data)
+            for contract_function, data in zip(contract_functions, return_data)
+        ]
+
+    def submit_call(self, contract_function: ContractFunction) -> Future:
+        """Queue a read-only call, to be aggregated with concurrent ones.
+
+        Calls submitted from several threads within a short window, to any of
+        the methods sharing this method's scheduler, are executed together via
+        :meth:`aggregate_calls`, in one eth_call to the Multicall3 contract.
+        The window adapts to how many calls are in flight.
+
+        :param contract_function: Contract function, with its arguments
+            already bound, to be called.
+        :returns: A :class:`concurrent.futures.Future` for the decoded return
+            value of the call.
+        """
+        if self._batch_scheduler is None:
+            # racing threads may each create one, costing only some batching
+            self._batch_scheduler = BatchScheduler()
+        return self._batch_scheduler.submit(
+            contract_function, self._aggregate_submitted_calls
+        )
+
+    def _aggregate_submitted_calls(
+        self, contract_functions: List[ContractFunction]
+    ) -> List[Any]:
+        return self.aggregate_calls(contract_functions, TxParams())
+
+    def call_by_selector(
+        self,
+        signature: Tuple[str, Sequence[str], Sequence[str]],
+        args: Sequence[Any],
+        tx_params: TxParams,
+        block_identifier: Union[int, str, bytes] = "latest",
+    ) -> Any:
+        """Execute a read-only method via eth_call, encoding the call directly.
+
+        Bypasses the construction of a web3 `ContractFunction`:code: and its
+        generic ABI lookup, for methods whose signature is known when the
+        wrapper is generated.  Tuple parameters are not supported.
+
+        :param signature: Hex string of the method's 4-byte selector, then
+            the ABI types of the method's inputs, then those of its outputs.
+        :param args: Arguments to the method, already validated.  They are
+            converted as web3 would convert them, so that eg a hex string is
+            accepted for a `bytes32`:code: parameter.
+        :param tx_params: Transaction parameters for the eth_call.
+        :param block_identifier: Block at which to execute the call.  If it
+            names a specific block, by number or hash, rather than by a tag
+            such as "latest", then the result is cached in the cache given to
+            the constructor, if any.
+        :returns: The decoded return value, as web3 would return it.
+        """
+        (selector, input_types, output_types) = signature
+        transaction = tx_params.as_dict()
+        transaction["to"] = self._contract_address
+        transaction["data"] = (
+            selector
+            + encode_abi(
+                input_types,
+                [
+                    _normalize_argument(input_type, arg)
+                    for input_type, arg in zip(input_types, args)
+                ],
+            ).hex()
+        )
+        return self._call_and_decode(
+            transaction,
+            [{"type": output_type} for output_type in output_types],
+            block_identifier,
+        )
+
+    def call_function(
+        self,
+        contract_function: ContractFunction,
+        tx_params: TxParams,
+        block_identifier: Union[int, str, bytes] = "latest",
+    ) -> Any:
+        """Execute a contract function via eth_call.
+
+        For methods which :meth:`call_by_selector` doesn't support, calls made
+        at a specific block are cached just as they are there.
+
+        :param contract_function: Contract function, with its arguments
+            already bound, to be called.
+        :param tx_params: Transaction parameters for the eth_call.
+        :param block_identifier: Block at which to execute the call.
+        :returns: The decoded return value.
+        """
+        if self._cache is None or not _is_specific_block(block_identifier):
+            return contract_function.call(
+                tx_params.as_dict(), block_identifier
+            )
+        transaction = tx_params.as_dict()
+        transaction["to"] = contract_function.address
+        # pylint: disable=protected-access
+        transaction["data"] = contract_function._encode_transaction_data()
+        return self._call_and_decode(
+            transaction, contract_function.abi["outputs"], block_identifier
+        )
+
+    def _call_and_decode(
+        self,
+        transaction: Dict[str, Any],
+        outputs: Sequence[Dict[str, Any]],
+        block_identifier: Union[int, str, bytes],
+    ) -> Any:
+        block_identifier = self._resolve_block_identifier(block_identifier)
+        if self._cache is None or not _is_specific_block(block_identifier):
+            return_data = self._web3_eth.call(transaction, block_identifier)
+        else:
+            cache_key = (tuple(sorted(transaction.items())), block_identifier)
+            if cache_key in self._cache:
+                return_data = self._cache[cache_key]
+            else:
+                return_data = self._web3_eth.call(
+                    transaction, block_identifier
+                )
+                self._cache[cache_key] = return_data
+        if outputs and not return_data:
+            raise BadFunctionCallOutput(
+                "Could not transact with/call contract function, is contract"
+                " deployed correctly and chain synced?"
+            )
+        return _decode_return_data(outputs, return_data)
+
+    def _resolve_block_identifier(
+        self, block_identifier: Union[int, str, bytes]
+    ) -> Union[int, str]:
+        """Resolve a block identifier as web3 does for contract calls.
+
+        A block hash, which can't be passed to an eth_call as such, is looked
+        up to get the block's number, which is kept in the cache, if any, as
+        it can never change.  A negative block number counts back from the
+        latest block.
+        """
+        if isinstance(block_identifier, int) and block_identifier >= 0:
+            return block_identifier
+        if isinstance(block_identifier, str) and len(block_identifier) != 66:
+            if _is_specific_block(block_identifier):
+                # a hex block number, which web3 would mistake for a bad hash
+                return int(block_identifier, 16)
+            return block_identifier  # a tag, such as "latest"
+        if (
+            self._cache is None
+            or isinstance(block_identifier, int)
+            or not _is_specific_block(block_identifier)
+        ):
+            return parse_block_identifier(
+                Web3(self._provider), block_identifier
+            )
+        cache_key = ("blockNumber", HexBytes(block_identifier))
+        if cache_key not in self._cache:
+            self._cache[cache_key] = parse_block_identifier(
+                Web3(self._provider), block_identifier
+            )
+        return self._cache[cache_key]
+
+    def send_transactions(
+        self,
+        contract_functions: Sequence[ContractFunction],
+        tx_params: TxParams,
+    ) -> List[HexBytes]:
+        """Submit several independent transactions via batched requests.
+
+        Rather than one eth_estimateGas and one eth_sendTransaction round trip
+        per transaction, the gas estimates are requested together in one
+        JSON-RPC batch, and then the transactions are sent together in
+        another.  Since every transaction is estimated before any is sent, no
+        transaction may depend on the effects of another in the same batch.
+
+        Batches sent via an :class:`web3.HTTPProvider` bypass web3's
+        middleware, so eg transactions are not signed by signing middleware,
+        but sent to the node to be signed with one of its own accounts.  Via
+        other providers, the requests are made one at a time, through the
+        middleware of the contract functions' web3 instance.
+
+        :param contract_functions: Contract functions, with their arguments
+            already bound, to be transacted.
+        :param tx_params: Transaction parameters shared by all of the
+            transactions.  If a nonce is given, it's used for the first
+            transaction, and incremented for each subsequent one.
+        :returns: The hash of each transaction, in order.
+        :raises TransactionBatchError: if any of the transactions could not be
+            sent, bearing the hashes of those which were.
+        """
+        if not contract_functions:
+            return []
+        # as transact() would, so that eg signing middleware isn't bypassed,
+        # unless the batches are sent over HTTP
+        web3 = contract_functions[0].web3
+        transactions = []
+        for index, contract_function in enumerate(contract_functions):
+            transaction = tx_params.as_dict()
+            transaction["to"] = contract_function.address
+            # pylint: disable=protected-access
+            transaction["data"] = contract_function._encode_transaction_data()
+            if tx_params.nonce is not None:
+                transaction["nonce"] = tx_params.nonce + index
+            transactions.append(_to_rpc_transaction(transaction))
+
+        if tx_params.gas is None:
+            (latest_block, *gas_estimates) = _batch_results(
+                _make_batch_request(
+                    web3,
+                    [("eth_getBlockByNumber", ["latest", False])]
+                    + [
+                        ("eth_estimateGas", [transaction])
+                        for transaction in transactions
+                    ],
+                )
+            )
+            gas_limit = _to_int(latest_block["gasLimit"])
+            for transaction, gas_estimate in zip(transactions, gas_estimates):
+                transaction["gas"] = hex(
+                    min(gas_limit, _to_int(gas_estimate) + _GAS_BUFFER)
+                )
+
+        rpc_responses = _make_batch_request(
+            web3,
+            [
+                ("eth_sendTransaction", [transaction])
+                for transaction in transactions
+            ],
+        )
+        if any("error" in rpc_response for rpc_response in rpc_responses):
+            raise TransactionBatchError(
+                [
+                    HexBytes(rpc_response["result"])
+                    if "error" not in rpc_response
+                    else None
+                    for rpc_response in rpc_responses
+                ],
+                [rpc_response.get("error") for rpc_response in rpc_responses],
+            )
+        return [
+            HexBytes(rpc_response["result"]) for rpc_response in rpc_responses
+        ]
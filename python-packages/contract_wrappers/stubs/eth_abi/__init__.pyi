@@ -0,0 +1,5 @@
+from typing import Any, Iterable, Tuple
+
+def decode_abi(types: Iterable[str], data: bytes) -> Tuple[Any, ...]: ...
+
+def encode_abi(types: Iterable[str], args: Iterable[Any]) -> bytes: ...
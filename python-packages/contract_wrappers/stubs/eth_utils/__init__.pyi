@@ -1,7 +1,19 @@
-from typing import Union
+from typing import Any, Dict, Optional, Union
 
 def to_checksum_address(address: str) -> str: ...
 
+def to_bytes(
+    primitive: Any = None, hexstr: Optional[str] = None, text: Optional[str] = None
+) -> bytes: ...
+
 def remove_0x_prefix(hex_string: str) -> str: ...
 
 def is_address(address: Union[str, bytes]) -> bool: ...
+
+def is_0x_prefixed(value: Any) -> bool: ...
+
+def is_hex(value: Any) -> bool: ...
+
+def event_abi_to_log_topic(event_abi: Dict[str, Any]) -> bytes: ...
+
+def event_signature_to_log_topic(event_signature: str) -> bytes: ...
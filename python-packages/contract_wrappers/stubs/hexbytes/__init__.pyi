@@ -1 +1,5 @@
-class HexBytes: ...
+from typing import Union
+
+
+class HexBytes(bytes):
+    def __init__(self, val: Union[bool, bytearray, bytes, int, str]) -> None: ...
@@ -7,12 +7,26 @@ from web3.contract import Contract
 from web3.providers.base import BaseProvider
 
 
+class HTTPProvider(BaseProvider):
+    endpoint_uri: str
+
+    def get_request_kwargs(self) -> Dict[str, Any]: ...
+    ...
+
+
 class Web3:
     class HTTPProvider(BaseProvider):
         ...
 
     def __init__(self, provider: BaseProvider) -> None: ...
 
+    provider: BaseProvider
+
+    class manager:
+        @staticmethod
+        def request_blocking(method: str, params: Any) -> Any: ...
+        ...
+
     @staticmethod
     def sha3(
         primitive: Optional[Union[bytes, int, None]] = None,
@@ -45,9 +59,17 @@ class Web3:
 
         @staticmethod
         def getTransactionReceipt(tx_hash: Union[HexBytes, bytes]) -> Any: ...
+
+        @staticmethod
+        def call(
+            transaction: Dict[str, Any],
+            block_identifier: Union[int, str, bytes, None] = None
+        ) -> bytes: ...
         
         @staticmethod
-        def contract(address: str, abi: Dict) -> Contract: ...
+        def contract(
+            address: str, abi: Union[Dict, List[Dict[str, Any]]]
+        ) -> Contract: ...
         ...
 
         @staticmethod
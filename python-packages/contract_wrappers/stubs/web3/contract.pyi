@@ -1,4 +1,6 @@
-from typing import Any
+from typing import Any, Dict, Optional, Union
+
+from web3 import Web3
 
 
 class Contract:
@@ -11,7 +13,26 @@ class Contract:
 
 
 class ContractFunction:
+    address: str
+
+    web3: Web3
+
+    abi: Any
+
     def __call__(self, *args, **kwargs):
         ...
 
+    def _encode_transaction_data(self) -> str: ...
+
+    def call(
+        self,
+        transaction: Optional[Dict[str, Any]] = None,
+        block_identifier: Union[int, str, bytes] = "latest",
+    ) -> Any: ...
+
     ...
+
+
+def parse_block_identifier(
+    web3: Web3, block_identifier: Union[int, str, bytes]
+) -> Union[int, str]: ...
@@ -1,2 +1,6 @@
+from typing import Any, Dict, List
+
+
 class BaseProvider:
+    def make_request(self, method: str, params: List[Any]) -> Dict[str, Any]: ...
     ...
@@ -1,12 +1,15 @@
 """Fixtures for pytest."""
 
 import pytest
+from eth_abi import decode_abi, encode_abi
 from eth_utils import to_checksum_address
 from web3 import Web3
+from web3.providers.base import BaseProvider
 
 from zero_ex.order_utils import asset_data_utils
 from zero_ex.contract_addresses import NETWORK_TO_ADDRESSES, NetworkId
 from zero_ex.contract_artifacts import abi_by_name
+from zero_ex.contract_wrappers.bases import MULTICALL3_ADDRESS
 
 
 @pytest.fixture(scope="module")
@@ -68,3 +71,41 @@ def zrx_address():
 def zrx_asset_data(zrx_address):  # pylint: disable=redefined-outer-name
     """Get 0x asset data for ZRX token."""
     return asset_data_utils.encode_erc20(zrx_address)
+
+
+class MulticallProvider(BaseProvider):
+    """Fake provider, answering only eth_calls aggregated via Multicall3.
+
+    Each aggregated call is answered with its own call data, less the method
+    selector, so a method taking and returning one word echoes its argument.
+    """
+
+    def __init__(self):
+        """Initialize the instance."""
+        self.requests = []
+
+    def make_request(self, method, params):
+        """Record the request, and answer it."""
+        self.requests.append((method, params))
+        if method == "eth_chainId":
+            return {"result": "0x539"}
+        assert method == "eth_call"
+        assert params[0]["to"] == MULTICALL3_ADDRESS
+        (calls,) = decode_abi(
+            ["(address,bytes)[]"], bytes.fromhex(params[0]["data"][10:])
+        )
+        return_data = [call_data[4:] for (_, call_data) in calls]
+        return {
+            "result": "0x"
+            + encode_abi(["uint256", "bytes[]"], [1, return_data]).hex()
+        }
+
+    def isConnected(self):  # pylint: disable=invalid-name
+        """Claim to be connected."""
+        return True
+
+
+@pytest.fixture(scope="function")
+def multicall_provider():
+    """Get a fake provider which answers calls aggregated via Multicall3."""
+    return MulticallProvider()
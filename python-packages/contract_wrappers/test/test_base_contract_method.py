@@ -1,9 +1,20 @@
 """Tests for :class:`ContractMethod`."""
 
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
 import pytest
+from eth_abi import encode_abi
+from web3.providers.base import BaseProvider
 
 from zero_ex.contract_addresses import NETWORK_TO_ADDRESSES, NetworkId
-from zero_ex.contract_wrappers.bases import ContractMethod
+from zero_ex.contract_wrappers import TxParams
+from zero_ex.contract_wrappers.bases import (
+    BatchScheduler,
+    ContractMethod,
+    _decode_return_data,
+    _is_specific_block,
+)
 
 
 @pytest.fixture(scope="module")
@@ -13,3 +24,164 @@ def contract_wrapper(ganache_provider):
         provider=ganache_provider,
         contract_address=NETWORK_TO_ADDRESSES[NetworkId.GANACHE].ether_token,
     )
+
+
+class _EchoProvider(BaseProvider):
+    """Fake provider, answering each eth_call with its own call data.
+
+    The method selector is dropped, so a method taking and returning the same
+    types echoes its arguments.
+    """
+
+    def __init__(self):
+        """Initialize the instance."""
+        self.requests = []
+
+    def make_request(self, method, params):
+        """Record the request, and answer it."""
+        self.requests.append((method, params))
+        if method == "eth_chainId":
+            return {"result": "0x539"}
+        assert method == "eth_call"
+        return {"result": "0x" + params[0]["data"][10:]}
+
+    def isConnected(self):  # pylint: disable=invalid-name
+        """Claim to be connected."""
+        return True
+
+
+def test_validate_and_checksum_address__caches_result():
+    """Test that checksumming an address repeatedly hashes it only once."""
+    address = NETWORK_TO_ADDRESSES[NetworkId.GANACHE].ether_token
+    hits_before = (
+        ContractMethod.validate_and_checksum_address.cache_info().hits
+    )
+    checksummed = ContractMethod.validate_and_checksum_address(address)
+    assert ContractMethod.validate_and_checksum_address(address) == checksummed
+    assert (
+        ContractMethod.validate_and_checksum_address.cache_info().hits
+        > hits_before
+    )
+
+
+def test_validate_and_checksum_address__rejects_invalid_address():
+    """Test that an invalid address is rejected, even on a repeated call."""
+    for _ in range(2):
+        with pytest.raises(TypeError):
+            ContractMethod.validate_and_checksum_address("0xinvalid")
+
+
+def test_batch_scheduler__aggregates_concurrent_calls():
+    """Test that calls submitted concurrently are executed in batches."""
+    batches = []
+
+    def aggregate(calls):
+        batches.append(calls)
+        return [call * 2 for call in calls]
+
+    scheduler = BatchScheduler(max_wait=0.05)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                lambda call: scheduler.submit(call, aggregate).result(),
+                range(8),
+            )
+        )
+
+    assert results == [call * 2 for call in range(8)]
+    assert len(batches) < 8
+
+
+def test_batch_scheduler__keeps_batching_after_lone_calls():
+    """Test that lone calls neither shrink batches nor close the window."""
+    batches = []
+
+    def aggregate(calls):
+        batches.append(len(calls))
+        return calls
+
+    scheduler = BatchScheduler(max_batch=4, max_wait=0.05)
+    for call in range(8):
+        assert scheduler.submit(call, aggregate).result() == call
+    assert scheduler.max_batch == 4
+    assert scheduler.max_wait == 0.05 / 4
+
+    futures = [scheduler.submit(call, aggregate) for call in range(4)]
+
+    assert [future.result() for future in futures] == list(range(4))
+    assert batches == [1] * 8 + [4]
+
+
+def test_batch_scheduler__grows_batches_under_backlog():
+    """Test that batches grow while calls queue up faster than they flush."""
+    batches = []
+    release = threading.Event()
+
+    def aggregate(calls):
+        release.wait()
+        batches.append(len(calls))
+        return calls
+
+    scheduler = BatchScheduler(max_batch=2, max_wait=0.05)
+    futures = [scheduler.submit(call, aggregate) for call in range(10)]
+    release.set()
+
+    assert [future.result() for future in futures] == list(range(10))
+    assert max(batches) > 2
+
+
+def test_decode_return_data__checksums_addresses():
+    """Test that addresses are checksummed, even within arrays and tuples."""
+    address = "0x" + "ab" * 20
+    checksummed = "0xABaBaBaBABabABabAbAbABAbABabababaBaBABaB"
+    outputs = [
+        {"type": "address"},
+        {"type": "address[]"},
+        {
+            "type": "tuple",
+            "components": [{"type": "uint256"}, {"type": "address"}],
+        },
+    ]
+
+    assert _decode_return_data(
+        outputs,
+        encode_abi(
+            ["address", "address[]", "(uint256,address)"],
+            [address, [address, address], (7, address)],
+        ),
+    ) == [checksummed, [checksummed, checksummed], (7, checksummed)]
+
+
+def test_decode_return_data__unwraps_single_output():
+    """Test that a lone return value isn't wrapped in a list."""
+    assert _decode_return_data(
+        [{"type": "uint256[]"}], encode_abi(["uint256[]"], [[1, 2]])
+    ) == [1, 2]
+
+
+def test_is_specific_block():
+    """Test that only block numbers and hashes count as specific blocks."""
+    for block_identifier in [123, "0x7b", "0x" + "ab" * 32, b"\xab" * 32]:
+        assert _is_specific_block(block_identifier)
+    for block_identifier in ["latest", "earliest", "pending", "finalized"]:
+        assert not _is_specific_block(block_identifier)
+
+
+def test_call_by_selector__accepts_hex_strings_for_bytes():
+    """Test that hex strings are converted for bytes parameters, as by web3."""
+    contract_method = ContractMethod(_EchoProvider(), "0x" + "22" * 20)
+    order_hash = b"\xab" * 32
+
+    assert (
+        contract_method.call_by_selector(
+            ("0x288cdc91", ["bytes32"], ["bytes32"]),
+            ["0x" + order_hash.hex()],
+            TxParams(),
+        )
+        == order_hash
+    )
+    assert contract_method.call_by_selector(
+        ("0x12345678", ["bytes32[]", "bytes"], ["bytes32[]", "bytes"]),
+        [[order_hash.hex()], "0xabcd"],
+        TxParams(),
+    ) == [[order_hash], b"\xab\xcd"]
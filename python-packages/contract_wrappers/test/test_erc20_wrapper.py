@@ -1,11 +1,18 @@
 """Tests for ERC20Token wrapper."""
 
+import json
 from decimal import Decimal
 
 import pytest
+import requests
+from eth_utils import event_signature_to_log_topic
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.providers.base import BaseProvider
 
 from zero_ex.contract_addresses import NETWORK_TO_ADDRESSES, NetworkId
 from zero_ex.contract_wrappers import TxParams
+from zero_ex.contract_wrappers.bases import TransactionBatchError
 from zero_ex.contract_wrappers.erc20_token import ERC20Token
 
 
@@ -74,3 +81,301 @@ def test_erc20_wrapper__approve(
 
     assert acc_1_weth_allowance == MAX_ALLOWANCE
     assert acc_2_weth_allowance == MAX_ALLOWANCE
+
+
+def test_erc20_wrapper__balance_of_at_block_is_cached(
+    accounts, ganache_provider, web3_eth
+):
+    """Test that a balance queried at a specific block is cached."""
+    cache: dict = {}
+    erc20_token = ERC20Token(
+        ganache_provider,
+        NETWORK_TO_ADDRESSES[NetworkId.GANACHE].ether_token,
+        cache=cache,
+    )
+    block_number = web3_eth.blockNumber
+
+    balance = erc20_token.balance_of.call(
+        accounts[0], block_identifier=block_number
+    )
+    assert len(cache) == 1
+    assert (
+        erc20_token.balance_of.call(accounts[0], block_identifier=block_number)
+        == balance
+    )
+    assert len(cache) == 1
+
+    erc20_token.balance_of.call(accounts[0])
+    assert len(cache) == 1
+
+
+def test_erc20_wrapper__approve_batch(
+    accounts,
+    erc20_proxy_address,
+    erc20_wrapper,  # pylint: disable=redefined-outer-name
+):
+    """Test approving several spenders via one batch of transactions."""
+    tx_hashes = erc20_wrapper.approve.send_transaction_batch(
+        [(erc20_proxy_address, 0), (accounts[2], 1)],
+        tx_params=TxParams(from_=accounts[0]),
+    )
+    assert len(tx_hashes) == 2
+
+    assert erc20_wrapper.allowance.call(accounts[0], erc20_proxy_address) == 0
+    assert erc20_wrapper.allowance.call(accounts[0], accounts[2]) == 1
+
+    erc20_wrapper.approve.send_transaction(
+        erc20_proxy_address,
+        MAX_ALLOWANCE,
+        tx_params=TxParams(from_=accounts[0]),
+    )
+
+
+def test_erc20_wrapper__balance_of_call_batch(multicall_provider):
+    """Test that a batch of balance queries is made via one eth_call."""
+    erc20_token = ERC20Token(
+        multicall_provider, NETWORK_TO_ADDRESSES[NetworkId.GANACHE].ether_token
+    )
+    owners = ["0x" + "11" * 20, "0x" + "22" * 20]
+    tx_params = TxParams(from_=owners[0])
+
+    for _ in range(2):
+        assert erc20_token.balance_of.call_batch(
+            [(owner,) for owner in owners], tx_params
+        ) == [int(owner, 16) for owner in owners]
+
+    assert [method for (method, _) in multicall_provider.requests].count(
+        "eth_call"
+    ) == 2
+
+
+class _BlockProvider(BaseProvider):
+    """Fake provider, knowing one block, at which every balance is 7."""
+
+    block_hash = "0x" + "cd" * 32
+
+    def __init__(self):
+        """Initialize the instance."""
+        self.requests = []
+
+    def make_request(self, method, params):
+        """Record the request, and answer it."""
+        self.requests.append((method, params))
+        if method == "eth_chainId":
+            return {"result": "0x539"}
+        if method == "eth_getBlockByHash":
+            assert params[0] == self.block_hash
+            return {"result": {"hash": self.block_hash, "number": "0x10"}}
+        assert method == "eth_call"
+        assert params[1] == "0x10"
+        return {"result": "0x" + (7).to_bytes(32, "big").hex()}
+
+    def isConnected(self):  # pylint: disable=invalid-name
+        """Claim to be connected."""
+        return True
+
+
+def test_erc20_wrapper__balance_of_at_block_hash():
+    """Test that a block hash is resolved to its number for an eth_call."""
+    owner = "0x" + "11" * 20
+    for block_identifier in [
+        _BlockProvider.block_hash,
+        HexBytes(_BlockProvider.block_hash),
+    ]:
+        for cache in [None, {}]:
+            provider = _BlockProvider()
+            erc20_token = ERC20Token(
+                provider,
+                NETWORK_TO_ADDRESSES[NetworkId.GANACHE].ether_token,
+                cache=cache,
+            )
+
+            for _ in range(2):
+                assert (
+                    erc20_token.balance_of.call(
+                        owner, block_identifier=block_identifier
+                    )
+                    == 7
+                )
+
+            methods = [method for (method, _) in provider.requests]
+            assert methods.count("eth_call") == (1 if cache is not None else 2)
+            assert methods.count("eth_getBlockByHash") == methods.count(
+                "eth_call"
+            )
+
+
+class _ReceiptProvider(BaseProvider):
+    """Fake provider, answering only requests for one transaction receipt."""
+
+    def __init__(self, logs):
+        """Initialize the instance."""
+        self.logs = logs
+
+    def make_request(self, method, params):
+        """Answer the request with a receipt bearing the given logs."""
+        assert method == "eth_getTransactionReceipt"
+        return {"result": {"transactionHash": params[0], "logs": self.logs}}
+
+    def isConnected(self):  # pylint: disable=invalid-name
+        """Claim to be connected."""
+        return True
+
+
+def test_erc20_wrapper__get_transfer_event():
+    """Test that only Transfer logs are decoded as Transfer events."""
+    token_address = NETWORK_TO_ADDRESSES[NetworkId.GANACHE].ether_token
+    tx_hash = "0x" + "ab" * 32
+
+    def make_log(signature, data):
+        return {
+            "address": token_address,
+            "topics": [
+                "0x" + event_signature_to_log_topic(signature).hex(),
+                "0x" + "00" * 12 + "11" * 20,
+                "0x" + "00" * 12 + "22" * 20,
+            ],
+            "data": "0x" + data.to_bytes(32, "big").hex(),
+            "logIndex": "0x0",
+            "transactionIndex": "0x0",
+            "transactionHash": tx_hash,
+            "blockHash": "0x" + "cd" * 32,
+            "blockNumber": "0x1",
+        }
+
+    erc20_token = ERC20Token(
+        _ReceiptProvider(
+            [
+                make_log("Approval(address,address,uint256)", 1),
+                make_log("Transfer(address,address,uint256)", 2),
+            ]
+        ),
+        token_address,
+    )
+
+    events = erc20_token.get_transfer_event(tx_hash)
+
+    assert [event.event for event in events] == ["Transfer"]
+    assert events[0]["args"]["_value"] == 2
+
+
+class _BatchResponse:
+    """Fake response from a node to a batch of JSON-RPC requests."""
+
+    def __init__(self, body):
+        """Initialize the instance."""
+        self.body = body
+
+    def raise_for_status(self):
+        """Don't raise, the HTTP request having succeeded."""
+
+    def json(self):
+        """Get the body of the response."""
+        return self.body
+
+
+def _send_approve_batch():
+    """Send a batch of two approvals via a (fake) HTTP provider."""
+    erc20_token = ERC20Token(
+        Web3.HTTPProvider(endpoint_uri="http://127.0.0.1:8545"),
+        NETWORK_TO_ADDRESSES[NetworkId.GANACHE].ether_token,
+    )
+    return erc20_token.approve.send_transaction_batch(
+        [("0x" + "22" * 20, 1), ("0x" + "22" * 20, 2)],
+        tx_params=TxParams(from_="0x" + "11" * 20, gas=100000),
+    )
+
+
+def test_erc20_wrapper__approve_batch__partly_sent(monkeypatch):
+    """Test that the hashes of the sent transactions survive a failure."""
+    tx_hash = "0x" + "ab" * 32
+
+    def post(_endpoint_uri, data, **kwargs):
+        assert kwargs["timeout"] > 0
+        (first_id, second_id) = [request["id"] for request in json.loads(data)]
+        return _BatchResponse(
+            [
+                {"jsonrpc": "2.0", "id": second_id, "error": "nonce too low"},
+                {"jsonrpc": "2.0", "id": first_id, "result": tx_hash},
+            ]
+        )
+
+    monkeypatch.setattr(requests, "post", post)
+    with pytest.raises(TransactionBatchError) as error:
+        _send_approve_batch()
+
+    assert error.value.tx_hashes == [HexBytes(tx_hash), None]
+    assert error.value.errors == [None, "nonce too low"]
+
+
+def test_erc20_wrapper__approve_batch__rejected(monkeypatch):
+    """Test that a batch rejected as a whole raises the node's error."""
+    monkeypatch.setattr(
+        requests,
+        "post",
+        lambda _endpoint_uri, data, **_kwargs: _BatchResponse(
+            {"jsonrpc": "2.0", "id": None, "error": "batch not supported"}
+        ),
+    )
+    with pytest.raises(ValueError, match="batch not supported"):
+        _send_approve_batch()
+
+
+class _RawTransactionProvider(BaseProvider):
+    """Fake provider, for a node which accepts only signed transactions."""
+
+    def __init__(self):
+        """Initialize the instance."""
+        self.requests = []
+
+    def make_request(self, method, params):
+        """Record the request, and answer it."""
+        self.requests.append((method, params))
+        if method == "eth_chainId":
+            return {"result": "0x539"}
+        if method == "eth_getBlockByNumber":
+            # as web3's gas price middleware checks for London fee fields
+            return {"result": {"number": "0x1", "gasLimit": "0x989680"}}
+        if method == "eth_sendRawTransaction":
+            return {"result": "0x" + params[0][-64:]}
+        assert method == "eth_sendTransaction"
+        return {"error": {"code": -32000, "message": "unknown account"}}
+
+    def isConnected(self):  # pylint: disable=invalid-name
+        """Claim to be connected."""
+        return True
+
+
+def test_erc20_wrapper__approve_batch__through_middleware():
+    """Test that a batch sent other than over HTTP passes through middleware.
+
+    The middleware here stands in for web3's signing middleware.
+    """
+
+    def raw_transaction_middleware(make_request, _web3):
+        def middleware(method, params):
+            if method == "eth_sendTransaction":
+                return make_request(
+                    "eth_sendRawTransaction", [params[0]["data"]]
+                )
+            return make_request(method, params)
+
+        return middleware
+
+    provider = _RawTransactionProvider()
+    provider.middlewares = [raw_transaction_middleware]
+    erc20_token = ERC20Token(
+        provider, NETWORK_TO_ADDRESSES[NetworkId.GANACHE].ether_token
+    )
+
+    tx_hashes = erc20_token.approve.send_transaction_batch(
+        [("0x" + "22" * 20, 1), ("0x" + "22" * 20, 2)],
+        tx_params=TxParams(from_="0x" + "11" * 20, gas=100000),
+    )
+
+    assert tx_hashes == [
+        HexBytes(value.to_bytes(32, "big")) for value in [1, 2]
+    ]
+    assert [method for (method, _) in provider.requests].count(
+        "eth_sendRawTransaction"
+    ) == 2
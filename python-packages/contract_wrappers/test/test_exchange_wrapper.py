@@ -88,6 +88,9 @@ def test_exchange_wrapper__fill_order(
 
     fill_event = exchange_wrapper.get_fill_event(tx_hash)
     assert_fill_log(fill_event[0].args, maker, taker, order, order_hash)
+    assert (
+        exchange_wrapper.filled.call(order_hash) == order["takerAssetAmount"]
+    )
 
 
 # pylint: disable=too-many-locals